@@ -13,13 +13,15 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath('..'))
 
+import periphery
+
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
 project = u'python-periphery'
 copyright = u'2015-2023, vsergeev / Ivan (Vanya) A. Sergeev'
 author = u'Vanya A. Sergeev'
-release = '2.4.1'
+release = periphery.__version__
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
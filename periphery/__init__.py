@@ -1,46 +1,297 @@
-import time
+import importlib
+import sys
+from time import sleep as _sleep
 
-__version__ = "2.4.1"
-"Module version string."
+# Alias long to int on Python 3
+if sys.version_info[0] >= 3:
+    long = int
 
 version = (2, 4, 1)
 "Module version tuple."
 
+__version__ = "{:d}.{:d}.{:d}".format(*version)
+"Module version string."
 
-def sleep(seconds):
-    """Sleep for the specified number of seconds.
+try:
+    from time import monotonic_ns as _monotonic_ns
+except ImportError:
+    try:
+        # Python 3.3 - 3.6
+        from time import monotonic as _monotonic
+    except ImportError:
+        # Python 2.7 has no monotonic clock in the standard library, so fall
+        # back to the wall clock. Busy-waits on it may run long or end early
+        # if the system time is stepped.
+        from time import time as _monotonic
 
-    Args:
-        seconds (int, long, float): duration in seconds.
+    def _monotonic_ns():
+        return int(_monotonic() * 1000000000)
 
-    """
-    time.sleep(seconds)
+try:
+    from time import clock_getres, CLOCK_MONOTONIC
+    _CLOCK_RESOLUTION_NS = int(clock_getres(CLOCK_MONOTONIC) * 1000000000)
+except ImportError:
+    # Python < 3.3
+    _CLOCK_RESOLUTION_NS = 0
+
+# Remaining duration below which sleeps busy-wait on the monotonic clock
+# instead of relying on time.sleep() wakeup latency (150us, plus a timer
+# tick on kernels without high resolution timers, where time.sleep() wakes
+# up on tick boundaries)
+_SPIN_THRESHOLD_NS = 150000 + (_CLOCK_RESOLUTION_NS if _CLOCK_RESOLUTION_NS > 1000 else 0)
+# Minimum remaining duration for which sleeps call time.sleep() before
+# busy-waiting (threshold above plus 50us)
+_SLEEP_THRESHOLD_NS = _SPIN_THRESHOLD_NS + 50000
 
 
-def sleep_ms(milliseconds):
+# Sleep for the specified number of seconds. Bound directly to time.sleep()
+# to avoid the overhead of a wrapper call.
+sleep = _sleep
+
+
+def sleep_ms(milliseconds, _sleep=_sleep, _monotonic_ns=_monotonic_ns):
     """Sleep for the specified number of milliseconds.
 
+    Sub-millisecond durations are completed with a busy-wait for accuracy.
+
     Args:
         milliseconds (int, long, float): duration in milliseconds.
 
+    Raises:
+        ValueError: if `milliseconds` is negative.
+
     """
-    time.sleep(milliseconds / 1000.0)
+    if milliseconds >= 1:
+        _sleep(milliseconds * 1e-3)
+        return
+    elif milliseconds < 0:
+        # Raises as time.sleep() does for a negative duration
+        _sleep(milliseconds * 1e-3)
 
+    deadline = _monotonic_ns() + int(milliseconds * 1000000)
 
-def sleep_us(microseconds):
+    while _monotonic_ns() < deadline:
+        pass
+
+
+def sleep_us(microseconds, _sleep=_sleep, _monotonic_ns=_monotonic_ns):
     """Sleep for the specified number of microseconds.
 
+    The bulk of the duration is slept with `time.sleep()`, and the final
+    ~150us are completed with a busy-wait on the monotonic clock, as the
+    wakeup latency of `time.sleep()` is typically tens of microseconds. On
+    kernels without high resolution timers, the busy-wait is extended by
+    one timer tick.
+
+    On Python 2.7, which lacks a monotonic clock, the busy-wait uses the wall
+    clock and is affected by steps of the system time.
+
     Args:
         microseconds (int, long, float): duration in microseconds.
 
+    Raises:
+        ValueError: if `microseconds` is negative.
+
     """
-    time.sleep(microseconds / 1000000.0)
+    duration = int(microseconds * 1000)
+    deadline = _monotonic_ns() + duration
+
+    if duration > _SLEEP_THRESHOLD_NS:
+        _sleep((duration - _SPIN_THRESHOLD_NS) * 1e-9)
+    elif microseconds < 0:
+        # Raises as time.sleep() does for a negative duration
+        _sleep(microseconds * 1e-6)
+
+    while _monotonic_ns() < deadline:
+        pass
+
+
+def sleep_until_ns(deadline, _sleep=_sleep, _monotonic_ns=_monotonic_ns):
+    """Sleep until the specified monotonic clock deadline.
+
+    Sleeping to an absolute deadline, rather than for a relative duration,
+    avoids accumulating drift from loop body execution time in periodic
+    loops. The final ~150us are completed with a busy-wait. A deadline that
+    has already passed returns immediately.
+
+    Args:
+        deadline (int): deadline in nanoseconds on the monotonic clock (as
+                        returned by `time.monotonic_ns()`).
+
+    """
+    remaining = deadline - _monotonic_ns()
+
+    if remaining > _SLEEP_THRESHOLD_NS:
+        _sleep((remaining - _SPIN_THRESHOLD_NS) * 1e-9)
+
+    while _monotonic_ns() < deadline:
+        pass
+
+
+def busy_wait_ns(nanoseconds, _monotonic_ns=_monotonic_ns):
+    """Busy-wait for the specified number of nanoseconds.
+
+    Unlike the sleep functions, this spins on the monotonic clock for the
+    entire duration and does not yield the CPU. It is intended for precise
+    delays under ~100us, e.g. pulse widths in bit-banging code. Other
+    Python threads continue to be scheduled during the busy-wait at the
+    interpreter's switch interval (see `sys.setswitchinterval()`).
+
+    Args:
+        nanoseconds (int): duration in nanoseconds.
+
+    """
+    deadline = _monotonic_ns() + nanoseconds
+
+    while _monotonic_ns() < deadline:
+        pass
+
+
+def pulse_schedule(deadlines, _sleep=_sleep, _monotonic_ns=_monotonic_ns):
+    """Wait for each of the specified monotonic clock deadlines in turn,
+    yielding after each one is reached.
+
+    This is intended for bit-banging loops, where per-edge calls to
+    `sleep_us()` accumulate drift and call overhead, e.g.:
+
+        for _ in periphery.pulse_schedule(deadlines):
+            gpio.write(not gpio.read())
+
+    Deadlines that have already passed are yielded immediately.
+
+    Args:
+        deadlines (iterable): deadlines in nanoseconds on the monotonic
+                              clock (as returned by `time.monotonic_ns()`),
+                              e.g. an ``array.array('q')``.
+
+    Yields:
+        int: deadline reached.
+
+    """
+    for deadline in deadlines:
+        remaining = deadline - _monotonic_ns()
+
+        if remaining > _SLEEP_THRESHOLD_NS:
+            _sleep((remaining - _SPIN_THRESHOLD_NS) * 1e-9)
+
+        while _monotonic_ns() < deadline:
+            pass
+
+        yield deadline
+
+
+class Pacer(object):
+    def __init__(self, period_ns):
+        """Instantiate a Pacer for running a loop at a fixed period without
+        drift, e.g.:
+
+            pacer = periphery.Pacer(10000)
+            while True:
+                gpio.write(not gpio.read())
+                pacer.tick()
+
+        Args:
+            period_ns (int, long): loop period in nanoseconds.
+
+        Returns:
+            Pacer: Pacer object.
+
+        Raises:
+            TypeError: if `period_ns` type is not int or long.
+            ValueError: if `period_ns` is not positive.
+
+        """
+        if not isinstance(period_ns, (int, long)):
+            raise TypeError("Invalid period type, should be integer.")
+        elif period_ns <= 0:
+            raise ValueError("Invalid period, should be positive.")
+
+        self._period_ns = period_ns
+        self._deadline = _monotonic_ns()
+
+    def tick(self):
+        """Sleep until the end of the current period, measured from the end
+        of the previous period.
+
+        If the loop has fallen behind by more than a period, this returns
+        immediately, and subsequent periods remain aligned to the original
+        schedule.
+
+        """
+        self._deadline += self._period_ns
+        sleep_until_ns(self._deadline)
+
+    @property
+    def period_ns(self):
+        """Get the loop period in nanoseconds.
+
+        :type: int
+        """
+        return self._period_ns
+
+
+__all__ = (
+    "version", "__version__",
+    "sleep", "sleep_ms", "sleep_us", "sleep_until_ns", "busy_wait_ns",
+    "pulse_schedule", "Pacer",
+    "asleep", "asleep_ms", "asleep_us",
+    "GPIO", "SysfsGPIO", "CdevGPIO", "GPIOBank", "EdgeEvent", "GPIOError",
+    "LED", "LEDError",
+    "PWM", "PWMError",
+    "SPI", "SPIError",
+    "I2C", "I2CError",
+    "MMIO", "MMIOError",
+    "Serial", "SerialError",
+)
+
+# Map of exported name to defining submodule, for lazy import
+_LAZY_IMPORTS = {
+    "asleep": "periphery._asleep",
+    "asleep_ms": "periphery._asleep",
+    "asleep_us": "periphery._asleep",
+    "GPIO": "periphery.gpio",
+    "SysfsGPIO": "periphery.gpio",
+    "CdevGPIO": "periphery.gpio",
+    "GPIOBank": "periphery.gpio",
+    "EdgeEvent": "periphery.gpio",
+    "GPIOError": "periphery.gpio",
+    "LED": "periphery.led",
+    "LEDError": "periphery.led",
+    "PWM": "periphery.pwm",
+    "PWMError": "periphery.pwm",
+    "SPI": "periphery.spi",
+    "SPIError": "periphery.spi",
+    "I2C": "periphery.i2c",
+    "I2CError": "periphery.i2c",
+    "MMIO": "periphery.mmio",
+    "MMIOError": "periphery.mmio",
+    "Serial": "periphery.serial",
+    "SerialError": "periphery.serial",
+}
+
+if sys.version_info >= (3, 7):
+    # Import peripheral submodules on first access (PEP 562)
+    def __getattr__(name):
+        if name not in _LAZY_IMPORTS:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+
+        return value
 
+    def __dir__():
+        return sorted(list(globals()) + list(_LAZY_IMPORTS))
+else:
+    from periphery.gpio import GPIO, SysfsGPIO, CdevGPIO, GPIOBank, EdgeEvent, GPIOError
+    from periphery.led import LED, LEDError
+    from periphery.pwm import PWM, PWMError
+    from periphery.spi import SPI, SPIError
+    from periphery.i2c import I2C, I2CError
+    from periphery.mmio import MMIO, MMIOError
+    from periphery.serial import Serial, SerialError
 
-from periphery.gpio import GPIO, SysfsGPIO, CdevGPIO, EdgeEvent, GPIOError
-from periphery.led import LED, LEDError
-from periphery.pwm import PWM, PWMError
-from periphery.spi import SPI, SPIError
-from periphery.i2c import I2C, I2CError
-from periphery.mmio import MMIO, MMIOError
-from periphery.serial import Serial, SerialError
+    if sys.version_info >= (3, 5):
+        from periphery._asleep import asleep, asleep_ms, asleep_us
+    else:
+        __all__ = tuple(name for name in __all__ if not name.startswith("asleep"))
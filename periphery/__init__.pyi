@@ -1,7 +1,10 @@
+from collections.abc import Awaitable, Iterable, Iterator
+
 from periphery.gpio import (
     GPIO as GPIO,
     CdevGPIO as CdevGPIO,
     EdgeEvent as EdgeEvent,
+    GPIOBank as GPIOBank,
     GPIOError as GPIOError,
     SysfsGPIO as SysfsGPIO,
 )
@@ -12,8 +15,37 @@ from periphery.pwm import PWM as PWM, PWMError as PWMError
 from periphery.serial import Serial as Serial, SerialError as SerialError
 from periphery.spi import SPI as SPI, SPIError as SPIError
 
+__all__ = (
+    "version", "__version__",
+    "sleep", "sleep_ms", "sleep_us", "sleep_until_ns", "busy_wait_ns",
+    "pulse_schedule", "Pacer",
+    "asleep", "asleep_ms", "asleep_us",
+    "GPIO", "SysfsGPIO", "CdevGPIO", "GPIOBank", "EdgeEvent", "GPIOError",
+    "LED", "LEDError",
+    "PWM", "PWMError",
+    "SPI", "SPIError",
+    "I2C", "I2CError",
+    "MMIO", "MMIOError",
+    "Serial", "SerialError",
+)
+
 version: tuple[int, int, int]
+__version__: str
 
+def _monotonic_ns() -> int: ...
 def sleep(seconds: float) -> None: ...
 def sleep_ms(milliseconds: float) -> None: ...
 def sleep_us(microseconds: float) -> None: ...
+def sleep_until_ns(deadline: int) -> None: ...
+def busy_wait_ns(nanoseconds: int) -> None: ...
+def pulse_schedule(deadlines: Iterable[int]) -> Iterator[int]: ...
+
+class Pacer:
+    def __init__(self, period_ns: int) -> None: ...
+    def tick(self) -> None: ...
+    @property
+    def period_ns(self) -> int: ...
+
+def asleep(seconds: float) -> Awaitable[None]: ...
+def asleep_ms(milliseconds: float) -> Awaitable[None]: ...
+def asleep_us(microseconds: float) -> Awaitable[None]: ...
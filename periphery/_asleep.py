@@ -0,0 +1,72 @@
+import asyncio
+
+from . import _monotonic_ns
+
+
+def asleep(seconds):
+    """Sleep for the specified number of seconds without blocking the
+    asyncio event loop, e.g. ``await periphery.asleep(0.5)``.
+
+    Args:
+        seconds (int, float): duration in seconds.
+
+    Returns:
+        awaitable: awaitable that completes after the duration.
+
+    """
+    return asyncio.sleep(seconds)
+
+
+def asleep_ms(milliseconds):
+    """Sleep for the specified number of milliseconds without blocking the
+    asyncio event loop, e.g. ``await periphery.asleep_ms(10)``.
+
+    Args:
+        milliseconds (int, float): duration in milliseconds.
+
+    Returns:
+        awaitable: awaitable that completes after the duration.
+
+    """
+    return asleep_us(milliseconds * 1000)
+
+
+def asleep_us(microseconds, _monotonic_ns=_monotonic_ns):
+    """Sleep for the specified number of microseconds without blocking the
+    asyncio event loop, e.g. ``await periphery.asleep_us(100)``.
+
+    Durations under 500us are below the practical timer resolution of the
+    event loop, so they yield to the event loop once and then busy-wait the
+    remainder. These must be called from a coroutine or callback running in
+    the event loop.
+
+    Args:
+        microseconds (int, float): duration in microseconds.
+
+    Returns:
+        awaitable: awaitable that completes after the duration.
+
+    """
+    if microseconds >= 500:
+        return asyncio.sleep(microseconds * 1e-6)
+
+    deadline = _monotonic_ns() + int(microseconds * 1000)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except AttributeError:
+        # Python 3.5 - 3.6
+        loop = asyncio.get_event_loop()
+    future = loop.create_future()
+
+    def on_wakeup():
+        while _monotonic_ns() < deadline:
+            pass
+
+        if not future.done():
+            future.set_result(None)
+
+    # Yield to the event loop once, then busy-wait the remainder
+    loop.call_soon(on_wakeup)
+
+    return future
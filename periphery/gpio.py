@@ -1,6 +1,46 @@
 import collections
 import os
 import select
+import threading
+
+
+# Valid property values
+_DIRECTIONS = frozenset(["in", "out", "high", "low"])
+_EDGES = frozenset(["none", "rising", "falling", "both"])
+_BIASES = frozenset(["default", "pull_up", "pull_down", "disable"])
+_DRIVES = frozenset(["default", "open_drain", "open_source"])
+
+# Valid timeout types
+_TIMEOUT_TYPES = (int, float, type(None))
+
+
+# GPIO chip file descriptors, shared by all character device GPIOs opened on
+# the same chip path and closed with the last of them. Maps chip path to a
+# [fd, reference count] pair. The lock is reentrant, as a GPIO may be closed
+# by garbage collection while it is held.
+_chip_fds = {}
+_chip_fds_lock = threading.RLock()
+
+
+def _open_chip(path):
+    with _chip_fds_lock:
+        entry = _chip_fds.get(path)
+        if entry is None:
+            entry = _chip_fds[path] = [os.open(path, 0), 0]
+
+        entry[1] += 1
+
+        return entry[0]
+
+
+def _close_chip(path):
+    with _chip_fds_lock:
+        entry = _chip_fds[path]
+
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _chip_fds[path]
+            os.close(entry[0])
 
 
 class GPIOError(IOError):
@@ -9,14 +49,33 @@ class GPIOError(IOError):
 
 
 class EdgeEvent(collections.namedtuple('EdgeEvent', ['edge', 'timestamp'])):
-    def __new__(cls, edge, timestamp):
-        """EdgeEvent containing the event edge and event time reported by Linux.
+    """EdgeEvent containing the event edge and event time reported by Linux.
 
-        Args:
-            edge (str): event edge, either "rising" or "falling".
-            timestamp (int): event time in nanoseconds.
-        """
-        return super(EdgeEvent, cls).__new__(cls, edge, timestamp)
+    Args:
+        edge (str): event edge, either "rising" or "falling".
+        timestamp (int): event time in nanoseconds.
+    """
+    __slots__ = ()
+
+
+class GPIOSnapshot(collections.namedtuple('GPIOSnapshot', ['line', 'name', 'label', 'direction', 'edge', 'bias', 'drive', 'inverted', 'value', 'chip_name', 'chip_label'])):
+    """GPIOSnapshot containing the state and properties of a GPIO at one
+    point in time.
+
+    Args:
+        line (int): GPIO line number.
+        name (str): GPIO line name.
+        label (str): GPIO line consumer label.
+        direction (str): GPIO direction, either "in" or "out".
+        edge (str): GPIO interrupt edge.
+        bias (str): GPIO line bias.
+        drive (str): GPIO line drive.
+        inverted (bool): GPIO is inverted (active low).
+        value (bool): GPIO state.
+        chip_name (str): GPIO chip name.
+        chip_label (str): GPIO chip label.
+    """
+    __slots__ = ()
 
 
 class GPIO(object):
@@ -29,6 +88,62 @@ class GPIO(object):
     def __del__(self):
         self.close()
 
+    @staticmethod
+    def open_cdev(path, line, direction, **kwargs):
+        """Open a character device GPIO.
+
+        This is equivalent to ``GPIO(path, line, direction, **kwargs)``, but
+        constructs the character device GPIO directly instead of selecting the
+        GPIO type from the arguments. See the character device GPIO
+        constructor for the supported keyword arguments.
+
+        Args:
+            path (str): GPIO chip character device path.
+            line (int, str): GPIO line number or name.
+            direction (str): GPIO direction, can be "in", "out", "high", or
+                             "low".
+            **kwargs: optional edge, bias, drive, inverted, and label.
+
+        Returns:
+            GPIO: character device GPIO object.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if an argument type is invalid.
+            ValueError: if an argument value is invalid.
+            LookupError: if the GPIO line was not found by the provided name.
+
+        """
+        return CdevGPIO(path, line, direction, **kwargs)
+
+    @staticmethod
+    def open_sysfs(line, direction, cache_direction=False, keep_exported=False):
+        """Open a sysfs GPIO.
+
+        This is equivalent to ``GPIO(line, direction)``, but constructs the
+        sysfs GPIO directly instead of selecting the GPIO type from the
+        arguments.
+
+        Args:
+            line (int): GPIO line number.
+            direction (str): GPIO direction, can be "in", "out", "high", or
+                             "low".
+            cache_direction (bool): cache the GPIO direction.
+            keep_exported (bool): leave the line exported on close.
+
+        Returns:
+            GPIO: sysfs GPIO object.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `line`, `direction`, `cache_direction`, or
+                       `keep_exported` types are invalid.
+            ValueError: if `direction` value is invalid.
+            TimeoutError: if waiting for GPIO export times out.
+
+        """
+        return SysfsGPIO(line, direction, cache_direction, keep_exported)
+
     def __enter__(self):
         return self
 
@@ -62,6 +177,69 @@ class GPIO(object):
         """
         raise NotImplementedError()
 
+    def write_fast(self, value):
+        """Set the state of the GPIO to `value`, without checking the value
+        type or the GPIO direction. This is intended for bit-banging in tight
+        loops on a GPIO known to be an output.
+
+        Args:
+            value (bool): ``True`` for high state, ``False`` for low state.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+
+        """
+        raise NotImplementedError()
+
+    def toggle(self):
+        """Toggle the state of the GPIO.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+
+        """
+        raise NotImplementedError()
+
+    def write_many(self, values):
+        """Set the state of the GPIO to each of `values` in turn, as fast as
+        possible. This is intended for bit-banging.
+
+        To set the states of several lines of a GPIO chip at once, use a
+        `GPIOBank` instead.
+
+        Args:
+            values (list, tuple): sequence of bool states, ``True`` for high
+                                  state, ``False`` for low state.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `values` type is not list or tuple, or if a value
+                       type is not bool.
+
+        """
+        raise NotImplementedError()
+
+    def snapshot(self):
+        """Get the state and properties of the GPIO at once.
+
+        Only the GPIO state is read from the kernel. The line and chip names
+        and labels are cached after their first query, and the remaining
+        properties are tracked by the GPIO object.
+
+        This method is intended for use with character device GPIOs and is
+        unsupported by sysfs GPIOs.
+
+        Returns:
+            GPIOSnapshot: a namedtuple containing the state and properties of
+            the GPIO.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            NotImplementedError: if called on a sysfs GPIO.
+
+        """
+        return GPIOSnapshot(self.line, self.name, self.label, self.direction, self.edge, self.bias, self.drive, self.inverted, self.read(), self.chip_name, self.chip_label)
+
     def poll(self, timeout=None):
         """Poll a GPIO for the edge event configured with the .edge property
         with an optional timeout.
@@ -82,7 +260,7 @@ class GPIO(object):
 
         Raises:
             GPIOError: if an I/O or OS error occurs.
-            TypeError: if `timeout` type is not None or int.
+            TypeError: if `timeout` type is not None, int, or float.
 
         """
         raise NotImplementedError()
@@ -105,6 +283,137 @@ class GPIO(object):
         """
         raise NotImplementedError()
 
+    def wait_event(self, timeout=None):
+        """Wait for and read the next edge event that occurs with the GPIO,
+        with an optional timeout.
+
+        This combines `poll()` and `read_event()`. For a blocking wait, the
+        edge event is read directly, which blocks until one is available.
+
+        `timeout` can be a positive number for a timeout in seconds, zero for a
+        non-blocking wait, or negative or None for a blocking wait. Default is
+        a blocking wait.
+
+        This method is intended for use with character device GPIOs and is
+        unsupported by sysfs GPIOs.
+
+        Args:
+            timeout (int, float, None): timeout duration in seconds.
+
+        Returns:
+            EdgeEvent or None: the edge event that occurred, or ``None`` on
+            timeout.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `timeout` type is not None, int, or float.
+            NotImplementedError: if called on a sysfs GPIO.
+
+        """
+        if not isinstance(timeout, _TIMEOUT_TYPES):
+            raise TypeError("Invalid timeout type, should be integer, float, or None.")
+
+        if timeout is not None and timeout >= 0 and not self.poll(timeout):
+            return None
+
+        return self.read_event()
+
+    def wait_event_async(self, timeout=None):
+        """Wait for and read the next edge event that occurs with the GPIO
+        asynchronously, with an optional timeout.
+
+        This is the asyncio counterpart of `wait_event()`. The GPIO file
+        descriptor is watched by the running event loop with `add_reader()`,
+        so edge events can be awaited alongside other I/O without blocking a
+        thread. It is called from a coroutine or callback running in the event
+        loop, and the returned future is awaited for the edge event, e.g.
+        ``event = await gpio.wait_event_async(1.0)``.
+
+        `timeout` can be a positive number for a timeout in seconds, zero for a
+        wait limited to the next event loop iteration, or negative or None for
+        no timeout. Default is no timeout.
+
+        This method requires Python 3.5 or later. It is intended for use with
+        character device GPIOs and is unsupported by sysfs GPIOs.
+
+        Args:
+            timeout (int, float, None): timeout duration in seconds.
+
+        Returns:
+            asyncio.Future: future for the edge event that occurred, or
+            ``None`` on timeout.
+
+        Raises:
+            GPIOError: if the GPIO is not an input or its edge is not set.
+            TypeError: if `timeout` type is not None, int, or float.
+            NotImplementedError: if called on a sysfs GPIO.
+
+        """
+        import asyncio
+
+        if not isinstance(timeout, _TIMEOUT_TYPES):
+            raise TypeError("Invalid timeout type, should be integer, float, or None.")
+        elif self.direction != "in":
+            raise GPIOError(None, "Invalid operation: cannot read event of output GPIO")
+        elif self.edge == "none":
+            raise GPIOError(None, "Invalid operation: GPIO edge not set")
+
+        try:
+            loop = asyncio.get_running_loop()
+        except AttributeError:
+            # Python 3.5 - 3.6
+            loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        fd = self.fd
+
+        def on_readable():
+            if not future.done():
+                try:
+                    future.set_result(self.read_event())
+                except Exception as e:
+                    future.set_exception(e)
+
+        def on_timeout():
+            if not future.done():
+                future.set_result(None)
+
+        loop.add_reader(fd, on_readable)
+        timer = loop.call_later(timeout, on_timeout) if timeout is not None and timeout >= 0 else None
+
+        def on_done(_):
+            # Also runs if the awaiting task is cancelled
+            loop.remove_reader(fd)
+            if timer is not None:
+                timer.cancel()
+
+        future.add_done_callback(on_done)
+
+        return future
+
+    def read_events(self, max_events=16):
+        """Read up to `max_events` edge events that occurred with the GPIO
+        with a single read, blocking until at least one edge event is
+        available.
+
+        This method is intended for use with character device GPIOs and is
+        unsupported by sysfs GPIOs.
+
+        Args:
+            max_events (int): maximum number of edge events to read.
+
+        Returns:
+            list: list of EdgeEvent namedtuples, in the order the edge events
+            occurred.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `max_events` type is not int.
+            ValueError: if `max_events` is not positive.
+            NotImplementedError: if called on a sysfs GPIO.
+
+        """
+        raise NotImplementedError()
+
     @staticmethod
     def poll_multiple(gpios, timeout=None):
         """Poll multiple GPIOs for the edge event configured with the .edge
@@ -127,45 +436,37 @@ class GPIO(object):
 
         Raises:
             GPIOError: if an I/O or OS error occurs.
-            TypeError: if `timeout` type is not None or int.
+            TypeError: if `timeout` type is not None, int, or float.
 
         """
-        if not isinstance(timeout, (int, float, type(None))):
+        if not isinstance(timeout, _TIMEOUT_TYPES):
             raise TypeError("Invalid timeout type, should be integer, float, or None.")
 
-        # Setup poll
-        p = select.poll()
+        # Setup epoll
+        p = select.epoll()
 
-        # Register GPIO file descriptors and build map of fd to object
-        fd_gpio_map = {}
-        for gpio in gpios:
-            if isinstance(gpio, SysfsGPIO):
-                p.register(gpio.fd, select.POLLPRI | select.POLLERR)
-            else:
-                p.register(gpio.fd, select.POLLIN | select.POLLRDNORM)
+        try:
+            # Register GPIO file descriptors and build map of fd to object,
+            # skipping duplicates, which epoll would reject
+            fd_gpio_map = {}
+            for gpio in gpios:
+                if gpio.fd in fd_gpio_map:
+                    continue
+                elif isinstance(gpio, SysfsGPIO):
+                    p.register(gpio.fd, select.EPOLLPRI | select.EPOLLERR)
+                else:
+                    p.register(gpio.fd, select.EPOLLIN | select.EPOLLRDNORM)
 
-            fd_gpio_map[gpio.fd] = gpio
+                fd_gpio_map[gpio.fd] = gpio
 
-        # Scale timeout to milliseconds
-        if isinstance(timeout, (int, float)) and timeout > 0:
-            timeout *= 1000
+            # Poll
+            events = p.poll(-1 if timeout is None else timeout)
+        finally:
+            p.close()
 
-        # Poll
-        events = p.poll(timeout)
-
-        # Gather GPIOs that had edge events occur
-        results = []
-        for (fd, _) in events:
-            gpio = fd_gpio_map[fd]
-
-            results.append(gpio)
-
-            if isinstance(gpio, SysfsGPIO):
-                # Rewind for read
-                try:
-                    os.lseek(fd, 0, os.SEEK_SET)
-                except OSError as e:
-                    raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror)
+        # Gather GPIOs that had edge events occur. Sysfs GPIO values are read
+        # with pread() at offset 0, so no rewind is needed.
+        results = [fd_gpio_map[fd] for (fd, _) in events]
 
         return results
 
@@ -230,6 +531,9 @@ class GPIO(object):
     def chip_fd(self):
         """Get the GPIO chip file descriptor of the GPIO object.
 
+        The GPIO chip file descriptor is shared by all GPIO and GPIO bank
+        objects open on the same GPIO chip path.
+
         This method is intended for use with character device GPIOs and is unsupported by sysfs GPIOs.
 
         Raises:
@@ -361,10 +665,155 @@ class GPIO(object):
         raise NotImplementedError()
 
 
+class GPIOBank(object):
+    def __new__(cls, *args, **kwargs):
+        return CdevGPIOBank.__new__(cls, *args, **kwargs)
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, value, traceback):
+        self.close()
+
+    # Methods
+
+    def read(self):
+        """Read the state of all lines of the GPIO bank with a single ioctl.
+
+        Returns:
+            int: bitmask of line states, where bit ``i`` is the state of the
+            ``i``-th line of `lines`.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+
+        """
+        raise NotImplementedError()
+
+    def write(self, values, mask=None):
+        """Set the state of the lines of the GPIO bank selected by `mask` to
+        `values` with a single ioctl.
+
+        Args:
+            values (int, long): bitmask of line states, where bit ``i`` is the
+                                state of the ``i``-th line of `lines`.
+            mask (int, long, None): bitmask of lines to set, or None for all
+                                    lines.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `values` or `mask` types are invalid.
+
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """Close the GPIO bank.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+
+        """
+        raise NotImplementedError()
+
+    # Immutable properties
+
+    @property
+    def devpath(self):
+        """Get the device path of the underlying GPIO chip.
+
+        :type: str
+        """
+        raise NotImplementedError()
+
+    @property
+    def fd(self):
+        """Get the line file descriptor of the GPIO bank object.
+
+        :type: int
+        """
+        raise NotImplementedError()
+
+    @property
+    def chip_fd(self):
+        """Get the GPIO chip file descriptor of the GPIO bank object.
+
+        The GPIO chip file descriptor is shared by all GPIO and GPIO bank
+        objects open on the same GPIO chip path.
+
+        :type: int
+        """
+        raise NotImplementedError()
+
+    @property
+    def lines(self):
+        """Get the GPIO bank object's line numbers, in bit order.
+
+        :type: tuple
+        """
+        raise NotImplementedError()
+
+    @property
+    def direction(self):
+        """Get the GPIO bank's direction, either "in" or "out".
+
+        :type: str
+        """
+        raise NotImplementedError()
+
+    @property
+    def bias(self):
+        """Get the GPIO bank's line bias.
+
+        :type: str
+        """
+        raise NotImplementedError()
+
+    @property
+    def drive(self):
+        """Get the GPIO bank's line drive.
+
+        :type: str
+        """
+        raise NotImplementedError()
+
+    @property
+    def inverted(self):
+        """Get the GPIO bank's inverted (active low) property.
+
+        :type: bool
+        """
+        raise NotImplementedError()
+
+    # String representation
+
+    def __str__(self):
+        """Get the string representation of the GPIO bank.
+
+        :type: str
+        """
+        raise NotImplementedError()
+
+
 # Assign GPIO classes
 from . import gpio_cdev1
 from . import gpio_cdev2
 from . import gpio_sysfs
 
 CdevGPIO = gpio_cdev2.Cdev2GPIO if gpio_cdev2.Cdev2GPIO.SUPPORTED else gpio_cdev1.Cdev1GPIO
+CdevGPIOBank = gpio_cdev2.Cdev2GPIOBank if gpio_cdev2.Cdev2GPIO.SUPPORTED else gpio_cdev1.Cdev1GPIOBank
 SysfsGPIO = gpio_sysfs.SysfsGPIO
+
+
+class _SysfsCdevGPIO(CdevGPIO):
+    # Character device GPIO opened in place of a sysfs GPIO, see
+    # gpio_sysfs.PREFER_CDEV. The character device path and line offset are
+    # resolved by SysfsGPIO.__new__(), which only opens lines without
+    # keep_exported this way. cache_direction has no effect, as the direction
+    # of a character device line is always known.
+    def __init__(self, line, direction, cache_direction=False, keep_exported=False):
+        path, offset = self._cdev_line
+        CdevGPIO.__init__(self, path, offset, direction)
@@ -1,22 +1,65 @@
+import asyncio
 from types import TracebackType
-from typing import Any
+from typing import Any, NamedTuple
 
 KERNEL_VERSION: tuple[int, int]
 
+_DIRECTIONS: frozenset[str]
+_EDGES: frozenset[str]
+_BIASES: frozenset[str]
+_DRIVES: frozenset[str]
+_TIMEOUT_TYPES: tuple[type, ...]
+
+def _open_chip(path: str) -> int: ...
+def _close_chip(path: str) -> None: ...
+
 class GPIOError(IOError): ...
 
 class EdgeEvent:
     def __new__(cls, edge: str, timestamp: int) -> EdgeEvent: ...  # noqa: Y034
 
+class GPIOSnapshot(NamedTuple):
+    line: int
+    name: str
+    label: str
+    direction: str
+    edge: str
+    bias: str
+    drive: str
+    inverted: bool
+    value: bool
+    chip_name: str
+    chip_label: str
+
 class GPIO:
     def __new__(cls, *args: Any, **kwargs: Any) -> GPIO: ...  # noqa: Y034
     def __del__(self) -> None: ...
+    @staticmethod
+    def open_cdev(
+        path: str,
+        line: int | str,
+        direction: str,
+        edge: str = ...,
+        bias: str = ...,
+        drive: str = ...,
+        inverted: bool = ...,
+        label: str | None = ...,
+    ) -> CdevGPIO: ...
+    @staticmethod
+    def open_sysfs(line: int, direction: str, cache_direction: bool = ..., keep_exported: bool = ...) -> SysfsGPIO: ...
     def __enter__(self) -> GPIO: ...  # noqa: Y034
     def __exit__(self, t: type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None) -> None: ...
     def read(self) -> bool: ...
     def write(self, value: bool) -> None: ...
+    def write_fast(self, value: bool) -> None: ...
+    def toggle(self) -> None: ...
+    def snapshot(self) -> GPIOSnapshot: ...
+    def write_many(self, values: list[bool] | tuple[bool, ...]) -> None: ...
     def poll(self, timeout: float | None = ...) -> bool: ...
     def read_event(self) -> EdgeEvent: ...
+    def wait_event(self, timeout: float | None = ...) -> EdgeEvent | None: ...
+    def wait_event_async(self, timeout: float | None = ...) -> asyncio.Future[EdgeEvent | None]: ...
+    def read_events(self, max_events: int = ...) -> list[EdgeEvent]: ...
     @staticmethod
     def poll_multiple(gpios: list[GPIO], timeout: float | None = ...) -> list[GPIO]: ...
     def close(self) -> None: ...
@@ -57,5 +100,43 @@ class CdevGPIO(GPIO):
     def __new__(self, path: str, line: int | str, direction: str, **kwargs: Any) -> CdevGPIO: ...  # noqa: Y034
 
 class SysfsGPIO(GPIO):
-    def __init__(self, line: int, direction: str) -> None: ...
-    def __new__(self, line: int, direction: str) -> SysfsGPIO: ...  # noqa: Y034
+    def __init__(self, line: int, direction: str, cache_direction: bool = ..., keep_exported: bool = ...) -> None: ...
+    def __new__(self, line: int, direction: str, cache_direction: bool = ..., keep_exported: bool = ...) -> SysfsGPIO: ...  # noqa: Y034
+
+class GPIOBank:
+    def __new__(cls, *args: Any, **kwargs: Any) -> GPIOBank: ...  # noqa: Y034
+    def __del__(self) -> None: ...
+    def __enter__(self) -> GPIOBank: ...  # noqa: Y034
+    def __exit__(self, t: type[BaseException] | None, value: BaseException | None, traceback: TracebackType | None) -> None: ...
+    def read(self) -> int: ...
+    def write(self, values: int, mask: int | None = ...) -> None: ...
+    def close(self) -> None: ...
+    @property
+    def devpath(self) -> str: ...
+    @property
+    def fd(self) -> int: ...
+    @property
+    def chip_fd(self) -> int: ...
+    @property
+    def lines(self) -> tuple[int, ...]: ...
+    @property
+    def direction(self) -> str: ...
+    @property
+    def bias(self) -> str: ...
+    @property
+    def drive(self) -> str: ...
+    @property
+    def inverted(self) -> bool: ...
+
+class CdevGPIOBank(GPIOBank):
+    def __init__(  # pyright: ignore [reportInconsistentConstructor]
+        self,
+        path: str,
+        lines: list[int] | tuple[int, ...],
+        direction: str,
+        bias: str = ...,
+        drive: str = ...,
+        inverted: bool = ...,
+        label: str | None = ...,
+    ) -> None: ...
+    def __new__(self, path: str, lines: list[int] | tuple[int, ...], direction: str, **kwargs: Any) -> CdevGPIOBank: ...  # noqa: Y034
@@ -3,8 +3,15 @@ import ctypes
 import fcntl
 import os
 import select
+import struct
+import sys
 
-from .gpio import GPIO, GPIOError, EdgeEvent
+from .gpio import GPIO, GPIOBank, GPIOError, EdgeEvent, _DIRECTIONS, _EDGES, _BIASES, _DRIVES, _TIMEOUT_TYPES, _open_chip, _close_chip
+
+
+# Alias long to int on Python 3
+if sys.version_info[0] >= 3:
+    long = int
 
 
 try:
@@ -51,6 +58,14 @@ class _CGpiohandleData(ctypes.Structure):
     ]
 
 
+class _CGpiohandleConfig(ctypes.Structure):
+    _fields_ = [
+        ('flags', ctypes.c_uint32),
+        ('default_values', ctypes.c_uint8 * _GPIOHANDLES_MAX),
+        ('padding', ctypes.c_uint32 * 4),
+    ]
+
+
 class _CGpioeventRequest(ctypes.Structure):
     _fields_ = [
         ('lineoffset', ctypes.c_uint32),
@@ -68,10 +83,19 @@ class _CGpioeventData(ctypes.Structure):
     ]
 
 
+# Unpacks timestamp and id from struct gpioevent_data
+_GPIOEVENT_DATA_STRUCT = struct.Struct("=QI")
+_GPIOEVENT_DATA_SIZE = ctypes.sizeof(_CGpioeventData)
+
+# Edge names indexed by GPIOEVENT_EVENT_* id
+_EDGE_NAMES = ("none", "rising", "falling")
+
+
 class Cdev1GPIO(GPIO):
     # Constants scraped from <linux/gpio.h>
     _GPIOHANDLE_GET_LINE_VALUES_IOCTL = 0xc040b408
     _GPIOHANDLE_SET_LINE_VALUES_IOCTL = 0xc040b409
+    _GPIOHANDLE_SET_CONFIG_IOCTL = 0xc054b40a
     _GPIO_GET_CHIPINFO_IOCTL = 0x8044b401
     _GPIO_GET_LINEINFO_IOCTL = 0xc048b402
     _GPIO_GET_LINEHANDLE_IOCTL = 0xc16cb403
@@ -91,6 +115,31 @@ class Cdev1GPIO(GPIO):
     _GPIOEVENT_EVENT_FALLING_EDGE = 0x2
 
     _SUPPORTS_LINE_BIAS = KERNEL_VERSION >= (5, 5)
+    _SUPPORTS_SET_CONFIG = KERNEL_VERSION >= (5, 5)
+
+    # Handle request flags for line bias and drive
+    _BIAS_FLAGS = {
+        "default": 0,
+        "pull_up": _GPIOHANDLE_REQUEST_BIAS_PULL_UP,
+        "pull_down": _GPIOHANDLE_REQUEST_BIAS_PULL_DOWN,
+        "disable": _GPIOHANDLE_REQUEST_BIAS_DISABLE,
+    } if _SUPPORTS_LINE_BIAS else {"default": 0}
+    _DRIVE_FLAGS = {
+        "default": 0,
+        "open_drain": _GPIOHANDLE_REQUEST_OPEN_DRAIN,
+        "open_source": _GPIOHANDLE_REQUEST_OPEN_SOURCE,
+    }
+
+    # Event request flags for line edge
+    _EDGE_FLAGS = {
+        "rising": _GPIOEVENT_REQUEST_RISING_EDGE,
+        "falling": _GPIOEVENT_REQUEST_FALLING_EDGE,
+        "both": _GPIOEVENT_REQUEST_BOTH_EDGES,
+    }
+
+    # Line name to line offset maps of GPIO chips, keyed by chip path, name,
+    # and label. Hits are confirmed against the line's info before use.
+    _line_names_cache = {}  # type: dict[tuple[str, bytes, bytes], dict[bytes, int]]
 
     def __init__(self, path, line, direction, edge="none", bias="default", drive="default", inverted=False, label=None):
         """**Character device GPIO (ABI version 1)**
@@ -136,6 +185,23 @@ class Cdev1GPIO(GPIO):
         self._drive = None
         self._inverted = None
         self._label = None
+        self._epoll = None
+        self._value = None
+
+        # Reused ioctl structures (line values as a raw buffer, as it's
+        # accessed in the read/write hot path)
+        self._handle_data = bytearray(ctypes.sizeof(_CGpiohandleData))
+        self._handle_data_low = bytearray(ctypes.sizeof(_CGpiohandleData))
+        self._handle_data_high = bytearray(ctypes.sizeof(_CGpiohandleData))
+        self._handle_data_high[0] = 1
+        self._handle_request = _CGpiohandleRequest()
+        self._event_request = _CGpioeventRequest()
+        self._line_info = _CGpiolineInfo()
+        self._chip_info = _CGpiochipInfo()
+        self._line_name = None
+        self._line_label = None
+        self._chip_name = None
+        self._chip_label = None
 
         self._open(path, line, direction, edge, bias, drive, inverted, label)
 
@@ -151,22 +217,22 @@ class Cdev1GPIO(GPIO):
 
         if not isinstance(direction, str):
             raise TypeError("Invalid direction type, should be string.")
-        elif direction not in ["in", "out", "high", "low"]:
+        elif direction not in _DIRECTIONS:
             raise ValueError("Invalid direction, can be: \"in\", \"out\", \"high\", \"low\".")
 
         if not isinstance(edge, str):
             raise TypeError("Invalid edge type, should be string.")
-        elif edge not in ["none", "rising", "falling", "both"]:
+        elif edge not in _EDGES:
             raise ValueError("Invalid edge, can be: \"none\", \"rising\", \"falling\", \"both\".")
 
         if not isinstance(bias, str):
             raise TypeError("Invalid bias type, should be string.")
-        elif bias not in ["default", "pull_up", "pull_down", "disable"]:
+        elif bias not in _BIASES:
             raise ValueError("Invalid bias, can be: \"default\", \"pull_up\", \"pull_down\", \"disable\".")
 
         if not isinstance(drive, str):
             raise TypeError("Invalid drive type, should be string.")
-        elif drive not in ["default", "open_drain", "open_source"]:
+        elif drive not in _DRIVES:
             raise ValueError("Invalid drive, can be: \"default\", \"open_drain\", \"open_source\".")
 
         if not isinstance(inverted, bool):
@@ -180,7 +246,7 @@ class Cdev1GPIO(GPIO):
 
         # Open GPIO chip
         try:
-            self._chip_fd = os.open(path, 0)
+            self._chip_fd = _open_chip(path)
         except OSError as e:
             raise GPIOError(e.errno, "Opening GPIO chip: " + e.strerror)
 
@@ -188,34 +254,39 @@ class Cdev1GPIO(GPIO):
         self._line = line
         self._label = label.encode() if label is not None else b"periphery"
 
+        # Fill in the fixed fields of the reused line requests
+        self._handle_request.lineoffsets[0] = line
+        self._handle_request.consumer_label = self._label
+        self._handle_request.lines = 1
+        self._event_request.lineoffset = line
+        self._event_request.consumer_label = self._label
+
         self._reopen(direction, edge, bias, drive, inverted)
 
-    def _reopen(self, direction, edge, bias, drive, inverted):
-        flags = 0
+    def _handle_flags(self, direction, bias, drive, inverted):
+        flags = Cdev1GPIO._GPIOHANDLE_REQUEST_INPUT if direction == "in" else Cdev1GPIO._GPIOHANDLE_REQUEST_OUTPUT
 
-        if bias != "default" and not Cdev1GPIO._SUPPORTS_LINE_BIAS:
+        try:
+            flags |= Cdev1GPIO._BIAS_FLAGS[bias]
+        except KeyError:
             raise GPIOError(None, "Line bias configuration not supported by kernel version {}.{}.".format(*KERNEL_VERSION))
-        elif bias == "pull_up":
-            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_BIAS_PULL_UP
-        elif bias == "pull_down":
-            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_BIAS_PULL_DOWN
-        elif bias == "disable":
-            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_BIAS_DISABLE
-
-        if drive == "open_drain":
-            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_OPEN_DRAIN
-        elif drive == "open_source":
-            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_OPEN_SOURCE
+
+        flags |= Cdev1GPIO._DRIVE_FLAGS[drive]
 
         if inverted:
             flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_ACTIVE_LOW
 
-        # FIXME this should really use GPIOHANDLE_SET_CONFIG_IOCTL instead of
-        # closing and reopening, especially to preserve output value on
-        # configuration changes
+        return flags
+
+    def _reopen(self, direction, edge, bias, drive, inverted):
+        flags = self._handle_flags(direction, bias, drive, inverted)
 
         # Close existing line
         if self._line_fd is not None:
+            if self._epoll is not None:
+                self._epoll.close()
+                self._epoll = None
+
             try:
                 os.close(self._line_fd)
             except OSError as e:
@@ -225,12 +296,10 @@ class Cdev1GPIO(GPIO):
 
         if direction == "in":
             if edge == "none":
-                request = _CGpiohandleRequest()
+                request = self._handle_request
 
-                request.lineoffsets[0] = self._line
-                request.flags = flags | Cdev1GPIO._GPIOHANDLE_REQUEST_INPUT
-                request.consumer_label = self._label
-                request.lines = 1
+                request.flags = flags
+                request.default_values[0] = 0
 
                 try:
                     fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEHANDLE_IOCTL, request)
@@ -239,12 +308,10 @@ class Cdev1GPIO(GPIO):
 
                 self._line_fd = request.fd
             else:
-                request = _CGpioeventRequest()
+                request = self._event_request
 
-                request.lineoffset = self._line
-                request.handleflags = flags | Cdev1GPIO._GPIOHANDLE_REQUEST_INPUT
-                request.eventflags = Cdev1GPIO._GPIOEVENT_REQUEST_RISING_EDGE if edge == "rising" else Cdev1GPIO._GPIOEVENT_REQUEST_FALLING_EDGE if edge == "falling" else Cdev1GPIO._GPIOEVENT_REQUEST_BOTH_EDGES
-                request.consumer_label = self._label
+                request.handleflags = flags
+                request.eventflags = Cdev1GPIO._EDGE_FLAGS[edge]
 
                 try:
                     fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEEVENT_IOCTL, request)
@@ -253,15 +320,12 @@ class Cdev1GPIO(GPIO):
 
                 self._line_fd = request.fd
         else:
-            request = _CGpiohandleRequest()
+            request = self._handle_request
             initial_value = True if direction == "high" else False
             initial_value ^= inverted
 
-            request.lineoffsets[0] = self._line
-            request.flags = flags | Cdev1GPIO._GPIOHANDLE_REQUEST_OUTPUT
+            request.flags = flags
             request.default_values[0] = initial_value
-            request.consumer_label = self._label
-            request.lines = 1
 
             try:
                 fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEHANDLE_IOCTL, request)
@@ -269,6 +333,7 @@ class Cdev1GPIO(GPIO):
                 raise GPIOError(e.errno, "Opening output line handle: " + e.strerror)
 
             self._line_fd = request.fd
+            self._value = initial_value
 
         self._direction = "in" if direction == "in" else "out"
         self._edge = edge
@@ -276,10 +341,37 @@ class Cdev1GPIO(GPIO):
         self._drive = drive
         self._inverted = inverted
 
+    def _reconfigure(self, bias, drive, inverted):
+        # Line event handles don't support reconfiguration, so fall back to
+        # reopening the line
+        if self._edge != "none" or not Cdev1GPIO._SUPPORTS_SET_CONFIG:
+            self._reopen(self._direction, self._edge, bias, drive, inverted)
+            return
+
+        config = _CGpiohandleConfig()
+        config.flags = self._handle_flags(self._direction, bias, drive, inverted)
+
+        if self._direction == "out":
+            # Preserve the physical output level
+            value = self._value ^ self._inverted ^ inverted
+            config.default_values[0] = value
+
+        try:
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_SET_CONFIG_IOCTL, config)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Setting line handle config: " + e.strerror)
+
+        if self._direction == "out":
+            self._value = value
+
+        self._bias = bias
+        self._drive = drive
+        self._inverted = inverted
+
     def _find_line_by_name(self, path, line):
         # Open GPIO chip
         try:
-            fd = os.open(path, 0)
+            fd = _open_chip(path)
         except OSError as e:
             raise GPIOError(e.errno, "Opening GPIO chip: " + e.strerror)
 
@@ -288,43 +380,98 @@ class Cdev1GPIO(GPIO):
         try:
             fcntl.ioctl(fd, Cdev1GPIO._GPIO_GET_CHIPINFO_IOCTL, chip_info)
         except (OSError, IOError) as e:
+            _close_chip(path)
             raise GPIOError(e.errno, "Querying GPIO chip info: " + e.strerror)
 
-        # Get each line info
+        key = (path, chip_info.name, chip_info.label)
+        name = line.encode()
         line_info = _CGpiolineInfo()
-        found = False
-        for i in range(chip_info.lines):
-            line_info.line_offset = i
+
+        # Look up the line in the chip's cached line names, confirming a hit
+        # with the line's info, as line names can be reconfigured (e.g. by a
+        # device tree overlay) while the chip keeps its name and label
+        offset = Cdev1GPIO._line_names_cache.get(key, {}).get(name)
+        if offset is not None:
+            line_info.line_offset = offset
             try:
                 fcntl.ioctl(fd, Cdev1GPIO._GPIO_GET_LINEINFO_IOCTL, line_info)
             except (OSError, IOError) as e:
+                _close_chip(path)
                 raise GPIOError(e.errno, "Querying GPIO line info: " + e.strerror)
 
-            if line_info.name.decode() == line:
-                found = True
-                break
+            if line_info.name != name:
+                offset = None
+
+        # Otherwise map the chip's line names from each line info
+        if offset is None:
+            line_names = {}
+            for i in range(chip_info.lines):
+                line_info.line_offset = i
+                try:
+                    fcntl.ioctl(fd, Cdev1GPIO._GPIO_GET_LINEINFO_IOCTL, line_info)
+                except (OSError, IOError) as e:
+                    _close_chip(path)
+                    raise GPIOError(e.errno, "Querying GPIO line info: " + e.strerror)
+
+                # Keep the first line for duplicate names
+                line_names.setdefault(line_info.name, i)
+
+            Cdev1GPIO._line_names_cache[key] = line_names
+            offset = line_names.get(name)
 
         try:
-            os.close(fd)
+            _close_chip(path)
         except OSError as e:
             raise GPIOError(e.errno, "Closing GPIO chip: " + e.strerror)
 
-        if found:
-            return i
+        if offset is not None:
+            return offset
 
         raise LookupError("Opening GPIO line: GPIO line \"{:s}\" not found by name.".format(line))
 
+    def _fetch_line_info(self):
+        # Line name is fixed and the consumer label is our own while the line
+        # is held, so only query them once
+        if self._line_name is None:
+            line_info = self._line_info
+            line_info.line_offset = self._line
+
+            try:
+                fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEINFO_IOCTL, line_info)
+            except (OSError, IOError) as e:
+                raise GPIOError(e.errno, "Querying GPIO line info: " + e.strerror)
+
+            self._line_name = line_info.name.decode()
+            self._line_label = line_info.consumer.decode()
+
+        return (self._line_name, self._line_label)
+
+    def _fetch_chip_info(self):
+        # Chip name and label are fixed, so only query them once
+        if self._chip_name is None:
+            chip_info = self._chip_info
+
+            try:
+                fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_CHIPINFO_IOCTL, chip_info)
+            except (OSError, IOError) as e:
+                raise GPIOError(e.errno, "Querying GPIO chip info: " + e.strerror)
+
+            self._chip_name = chip_info.name.decode()
+            self._chip_label = chip_info.label.decode()
+
+        return (self._chip_name, self._chip_label)
+
     # Methods
 
     def read(self):
-        data = _CGpiohandleData()
+        data = self._handle_data
 
         try:
-            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_GET_LINE_VALUES_IOCTL, data)
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_GET_LINE_VALUES_IOCTL, data, True)
         except (OSError, IOError) as e:
             raise GPIOError(e.errno, "Getting line value: " + e.strerror)
 
-        return bool(data.values[0])
+        return bool(data[0])
 
     def write(self, value):
         if not isinstance(value, bool):
@@ -332,31 +479,66 @@ class Cdev1GPIO(GPIO):
         elif self._direction != "out":
             raise GPIOError(None, "Invalid operation: cannot write to input GPIO")
 
-        data = _CGpiohandleData()
+        data = self._handle_data
+
+        data[0] = value
+
+        try:
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_SET_LINE_VALUES_IOCTL, data, True)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Setting line value: " + e.strerror)
 
-        data.values[0] = value
+        self._value = value
 
+    def write_fast(self, value):
         try:
-            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_SET_LINE_VALUES_IOCTL, data)
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_SET_LINE_VALUES_IOCTL, self._handle_data_high if value else self._handle_data_low, True)
         except (OSError, IOError) as e:
             raise GPIOError(e.errno, "Setting line value: " + e.strerror)
 
+        self._value = value
+
+    def toggle(self):
+        if self._direction != "out":
+            raise GPIOError(None, "Invalid operation: cannot write to input GPIO")
+
+        self.write(not self._value)
+
+    def write_many(self, values):
+        if not isinstance(values, (list, tuple)):
+            raise TypeError("Invalid values type, should be list or tuple.")
+        elif not all(isinstance(value, bool) for value in values):
+            raise TypeError("Invalid value type, should be bool.")
+        elif self._direction != "out":
+            raise GPIOError(None, "Invalid operation: cannot write to input GPIO")
+
+        data = self._handle_data
+        line_fd = self._line_fd
+
+        try:
+            for value in values:
+                data[0] = value
+                fcntl.ioctl(line_fd, Cdev1GPIO._GPIOHANDLE_SET_LINE_VALUES_IOCTL, data, True)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Setting line value: " + e.strerror)
+
+        if values:
+            self._value = values[-1]
+
     def poll(self, timeout=None):
-        if not isinstance(timeout, (int, float, type(None))):
+        if not isinstance(timeout, _TIMEOUT_TYPES):
             raise TypeError("Invalid timeout type, should be integer, float, or None.")
         elif self._direction != "in":
             raise GPIOError(None, "Invalid operation: cannot poll output GPIO")
 
-        # Setup poll
-        p = select.poll()
-        p.register(self._line_fd, select.POLLIN | select.POLLPRI | select.POLLERR)
-
-        # Scale timeout to milliseconds
-        if isinstance(timeout, (int, float)) and timeout > 0:
-            timeout *= 1000
+        # Setup epoll on first poll, and retain it for the lifetime of the
+        # line file descriptor
+        if self._epoll is None:
+            self._epoll = select.epoll()
+            self._epoll.register(self._line_fd, select.EPOLLIN | select.EPOLLPRI | select.EPOLLERR)
 
         # Poll
-        events = p.poll(timeout)
+        events = self._epoll.poll(-1 if timeout is None else timeout)
 
         return len(events) > 0
 
@@ -367,24 +549,41 @@ class Cdev1GPIO(GPIO):
             raise GPIOError(None, "Invalid operation: GPIO edge not set")
 
         try:
-            buf = os.read(self._line_fd, ctypes.sizeof(_CGpioeventData))
+            buf = os.read(self._line_fd, _GPIOEVENT_DATA_SIZE)
         except OSError as e:
             raise GPIOError(e.errno, "Reading GPIO event: " + e.strerror)
 
-        event_data = _CGpioeventData.from_buffer_copy(buf)
+        timestamp, event_id = _GPIOEVENT_DATA_STRUCT.unpack_from(buf)
 
-        if event_data.id == Cdev1GPIO._GPIOEVENT_EVENT_RISING_EDGE:
-            edge = "rising"
-        elif event_data.id == Cdev1GPIO._GPIOEVENT_EVENT_FALLING_EDGE:
-            edge = "falling"
-        else:
-            edge = "none"
+        return EdgeEvent(_EDGE_NAMES[event_id] if event_id < 3 else "none", timestamp)
+
+    def read_events(self, max_events=16):
+        if not isinstance(max_events, int):
+            raise TypeError("Invalid max events type, should be integer.")
+        elif max_events < 1:
+            raise ValueError("Invalid max events, should be positive.")
+        elif self._direction != "in":
+            raise GPIOError(None, "Invalid operation: cannot read event of output GPIO")
+        elif self._edge == "none":
+            raise GPIOError(None, "Invalid operation: GPIO edge not set")
+
+        try:
+            buf = os.read(self._line_fd, max_events * _GPIOEVENT_DATA_SIZE)
+        except OSError as e:
+            raise GPIOError(e.errno, "Reading GPIO events: " + e.strerror)
 
-        timestamp = event_data.timestamp
+        events = []
+        for offset in range(0, len(buf), _GPIOEVENT_DATA_SIZE):
+            timestamp, event_id = _GPIOEVENT_DATA_STRUCT.unpack_from(buf, offset)
+            events.append(EdgeEvent(_EDGE_NAMES[event_id] if event_id < 3 else "none", timestamp))
 
-        return EdgeEvent(edge, timestamp)
+        return events
 
     def close(self):
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
+
         try:
             if self._line_fd is not None:
                 os.close(self._line_fd)
@@ -393,7 +592,7 @@ class Cdev1GPIO(GPIO):
 
         try:
             if self._chip_fd is not None:
-                os.close(self._chip_fd)
+                _close_chip(self._devpath)
         except OSError as e:
             raise GPIOError(e.errno, "Closing GPIO chip: " + e.strerror)
 
@@ -419,27 +618,11 @@ class Cdev1GPIO(GPIO):
 
     @property
     def name(self):
-        line_info = _CGpiolineInfo()
-        line_info.line_offset = self._line
-
-        try:
-            fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEINFO_IOCTL, line_info)
-        except (OSError, IOError) as e:
-            raise GPIOError(e.errno, "Querying GPIO line info: " + e.strerror)
-
-        return line_info.name.decode()
+        return self._fetch_line_info()[0]
 
     @property
     def label(self):
-        line_info = _CGpiolineInfo()
-        line_info.line_offset = self._line
-
-        try:
-            fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEINFO_IOCTL, line_info)
-        except (OSError, IOError) as e:
-            raise GPIOError(e.errno, "Querying GPIO line info: " + e.strerror)
-
-        return line_info.consumer.decode()
+        return self._fetch_line_info()[1]
 
     @property
     def chip_fd(self):
@@ -447,25 +630,11 @@ class Cdev1GPIO(GPIO):
 
     @property
     def chip_name(self):
-        chip_info = _CGpiochipInfo()
-
-        try:
-            fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_CHIPINFO_IOCTL, chip_info)
-        except (OSError, IOError) as e:
-            raise GPIOError(e.errno, "Querying GPIO chip info: " + e.strerror)
-
-        return chip_info.name.decode()
+        return self._fetch_chip_info()[0]
 
     @property
     def chip_label(self):
-        chip_info = _CGpiochipInfo()
-
-        try:
-            fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_CHIPINFO_IOCTL, chip_info)
-        except (OSError, IOError) as e:
-            raise GPIOError(e.errno, "Querying GPIO chip info: " + e.strerror)
-
-        return chip_info.label.decode()
+        return self._fetch_chip_info()[1]
 
     # Mutable properties
 
@@ -475,11 +644,16 @@ class Cdev1GPIO(GPIO):
     def _set_direction(self, direction):
         if not isinstance(direction, str):
             raise TypeError("Invalid direction type, should be string.")
-        if direction not in ["in", "out", "high", "low"]:
+        if direction not in _DIRECTIONS:
             raise ValueError("Invalid direction, can be: \"in\", \"out\", \"high\", \"low\".")
 
         if self._direction == direction:
             return
+        elif self._direction == "out" and direction != "in":
+            # Already an output, so only the value needs to change
+            if direction != "out":
+                self.write((direction == "high") ^ self._inverted)
+            return
 
         self._reopen(direction, "none", self._bias, self._drive, self._inverted)
 
@@ -491,7 +665,7 @@ class Cdev1GPIO(GPIO):
     def _set_edge(self, edge):
         if not isinstance(edge, str):
             raise TypeError("Invalid edge type, should be string.")
-        if edge not in ["none", "rising", "falling", "both"]:
+        if edge not in _EDGES:
             raise ValueError("Invalid edge, can be: \"none\", \"rising\", \"falling\", \"both\".")
 
         if self._direction != "in":
@@ -510,13 +684,13 @@ class Cdev1GPIO(GPIO):
     def _set_bias(self, bias):
         if not isinstance(bias, str):
             raise TypeError("Invalid bias type, should be string.")
-        if bias not in ["default", "pull_up", "pull_down", "disable"]:
+        if bias not in _BIASES:
             raise ValueError("Invalid bias, can be: \"default\", \"pull_up\", \"pull_down\", \"disable\".")
 
         if self._bias == bias:
             return
 
-        self._reopen(self._direction, self._edge, bias, self._drive, self._inverted)
+        self._reconfigure(bias, self._drive, self._inverted)
 
     bias = property(_get_bias, _set_bias)
 
@@ -526,7 +700,7 @@ class Cdev1GPIO(GPIO):
     def _set_drive(self, drive):
         if not isinstance(drive, str):
             raise TypeError("Invalid drive type, should be string.")
-        if drive not in ["default", "open_drain", "open_source"]:
+        if drive not in _DRIVES:
             raise ValueError("Invalid drive, can be: \"default\", \"open_drain\", \"open_source\".")
 
         if self._direction != "out" and drive != "default":
@@ -535,7 +709,7 @@ class Cdev1GPIO(GPIO):
         if self._drive == drive:
             return
 
-        self._reopen(self._direction, self._edge, self._bias, drive, self._inverted)
+        self._reconfigure(self._bias, drive, self._inverted)
 
     drive = property(_get_drive, _set_drive)
 
@@ -549,7 +723,7 @@ class Cdev1GPIO(GPIO):
         if self._inverted == inverted:
             return
 
-        self._reopen(self._direction, self._edge, self._bias, self._drive, inverted)
+        self._reconfigure(self._bias, self._drive, inverted)
 
     inverted = property(_get_inverted, _set_inverted)
 
@@ -557,14 +731,9 @@ class Cdev1GPIO(GPIO):
 
     def __str__(self):
         try:
-            str_name = self.name
-        except GPIOError:
-            str_name = "<error>"
-
-        try:
-            str_label = self.label
+            str_name, str_label = self._fetch_line_info()
         except GPIOError:
-            str_label = "<error>"
+            str_name = str_label = "<error>"
 
         try:
             str_direction = self.direction
@@ -592,14 +761,237 @@ class Cdev1GPIO(GPIO):
             str_inverted = "<error>"
 
         try:
-            str_chip_name = self.chip_name
-        except GPIOError:
-            str_chip_name = "<error>"
-
-        try:
-            str_chip_label = self.chip_label
+            str_chip_name, str_chip_label = self._fetch_chip_info()
         except GPIOError:
-            str_chip_label = "<error>"
+            str_chip_name = str_chip_label = "<error>"
 
         return "GPIO {:d} (name=\"{:s}\", label=\"{:s}\", device={:s}, line_fd={:d}, chip_fd={:d}, direction={:s}, edge={:s}, bias={:s}, drive={:s}, inverted={:s}, chip_name=\"{:s}\", chip_label=\"{:s}\", type=cdev)" \
             .format(self._line, str_name, str_label, self._devpath, self._line_fd, self._chip_fd, str_direction, str_edge, str_bias, str_drive, str_inverted, str_chip_name, str_chip_label)
+
+
+class Cdev1GPIOBank(GPIOBank):
+    def __init__(self, path, lines, direction, bias="default", drive="default", inverted=False, label=None):
+        """**Character device GPIO bank (ABI version 1)**
+
+        Instantiate a GPIO bank object and open the specified lines of the
+        character device GPIO chip at the specified path (e.g.
+        "/dev/gpiochip0") with a single line handle request, so that the
+        states of all lines can be read or written with one ioctl. Defaults
+        properties can be overridden with keyword arguments.
+
+        Args:
+            path (str): GPIO chip character device path.
+            lines (list, tuple): GPIO line numbers, up to 64.
+            direction (str): GPIO direction, can be "in", "out", "high", or
+                             "low".
+            bias (str): GPIO line bias, can be "default", "pull_up",
+                        "pull_down", or "disable".
+            drive (str): GPIO line drive, can be "default", "open_drain", or
+                         "open_source".
+            inverted (bool): GPIO is inverted (active low).
+            label (str, None): GPIO line consumer label.
+
+        Returns:
+            Cdev1GPIOBank: GPIO bank object.
+
+        Raises:
+            GPIOError: if an I/O or OS error occurs.
+            TypeError: if `path`, `lines`, `direction`, `bias`, `drive`,
+                       `inverted`, or `label` types are invalid.
+            ValueError: if `lines`, `direction`, `bias`, or `drive` value is
+                        invalid.
+
+        """
+        self._devpath = None
+        self._lines = None
+        self._line_fd = None
+        self._chip_fd = None
+        self._direction = None
+        self._bias = None
+        self._drive = None
+        self._inverted = None
+        self._mask = None
+        self._values = None
+        self._handle_data = bytearray(ctypes.sizeof(_CGpiohandleData))
+
+        self._open(path, lines, direction, bias, drive, inverted, label)
+
+    def __new__(self, path, lines, direction, **kwargs):
+        return object.__new__(Cdev1GPIOBank)
+
+    def _open(self, path, lines, direction, bias, drive, inverted, label):
+        if not isinstance(path, str):
+            raise TypeError("Invalid path type, should be string.")
+
+        if not isinstance(lines, (list, tuple)):
+            raise TypeError("Invalid lines type, should be list or tuple.")
+        elif not all(isinstance(line, int) for line in lines):
+            raise TypeError("Invalid line type, should be integer.")
+        elif not 0 < len(lines) <= _GPIOHANDLES_MAX:
+            raise ValueError("Invalid number of lines, should be 1 to {:d}.".format(_GPIOHANDLES_MAX))
+
+        if not isinstance(direction, str):
+            raise TypeError("Invalid direction type, should be string.")
+        elif direction not in _DIRECTIONS:
+            raise ValueError("Invalid direction, can be: \"in\", \"out\", \"high\", \"low\".")
+
+        if not isinstance(bias, str):
+            raise TypeError("Invalid bias type, should be string.")
+        elif bias not in _BIASES:
+            raise ValueError("Invalid bias, can be: \"default\", \"pull_up\", \"pull_down\", \"disable\".")
+
+        if not isinstance(drive, str):
+            raise TypeError("Invalid drive type, should be string.")
+        elif drive not in _DRIVES:
+            raise ValueError("Invalid drive, can be: \"default\", \"open_drain\", \"open_source\".")
+
+        if not isinstance(inverted, bool):
+            raise TypeError("Invalid drive type, should be bool.")
+
+        if not isinstance(label, (type(None), str)):
+            raise TypeError("Invalid label type, should be None or str.")
+
+        flags = Cdev1GPIO._GPIOHANDLE_REQUEST_INPUT if direction == "in" else Cdev1GPIO._GPIOHANDLE_REQUEST_OUTPUT
+
+        try:
+            flags |= Cdev1GPIO._BIAS_FLAGS[bias]
+        except KeyError:
+            raise GPIOError(None, "Line bias configuration not supported by kernel version {}.{}.".format(*KERNEL_VERSION))
+
+        flags |= Cdev1GPIO._DRIVE_FLAGS[drive]
+
+        if inverted:
+            flags |= Cdev1GPIO._GPIOHANDLE_REQUEST_ACTIVE_LOW
+
+        # Open GPIO chip
+        try:
+            self._chip_fd = _open_chip(path)
+        except OSError as e:
+            raise GPIOError(e.errno, "Opening GPIO chip: " + e.strerror)
+
+        self._devpath = path
+
+        mask = (1 << len(lines)) - 1
+        initial_values = mask if direction == "high" else 0
+        if inverted:
+            initial_values ^= mask
+
+        request = _CGpiohandleRequest()
+
+        for i, line in enumerate(lines):
+            request.lineoffsets[i] = line
+            request.default_values[i] = (initial_values >> i) & 0x1
+        request.flags = flags
+        request.consumer_label = label.encode() if label is not None else b"periphery"
+        request.lines = len(lines)
+
+        try:
+            fcntl.ioctl(self._chip_fd, Cdev1GPIO._GPIO_GET_LINEHANDLE_IOCTL, request)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Opening line handle: " + e.strerror)
+
+        self._line_fd = request.fd
+        self._lines = tuple(lines)
+        self._direction = "in" if direction == "in" else "out"
+        self._bias = bias
+        self._drive = drive
+        self._inverted = inverted
+        self._mask = mask
+        self._values = initial_values
+
+    # Methods
+
+    def read(self):
+        data = self._handle_data
+
+        try:
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_GET_LINE_VALUES_IOCTL, data, True)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Getting line values: " + e.strerror)
+
+        values = 0
+        for i in range(len(self._lines)):
+            if data[i]:
+                values |= 1 << i
+
+        return values
+
+    def write(self, values, mask=None):
+        if not isinstance(values, (int, long)):
+            raise TypeError("Invalid values type, should be integer.")
+        elif not isinstance(mask, (int, long, type(None))):
+            raise TypeError("Invalid mask type, should be integer or None.")
+        elif self._direction != "out":
+            raise GPIOError(None, "Invalid operation: cannot write to input GPIO")
+
+        # ABI version 1 sets all lines of a handle, so merge with the last
+        # values written for lines outside of the mask
+        mask = self._mask if mask is None else mask & self._mask
+        values = (self._values & ~mask) | (values & mask)
+
+        data = self._handle_data
+        for i in range(len(self._lines)):
+            data[i] = (values >> i) & 0x1
+
+        try:
+            fcntl.ioctl(self._line_fd, Cdev1GPIO._GPIOHANDLE_SET_LINE_VALUES_IOCTL, data, True)
+        except (OSError, IOError) as e:
+            raise GPIOError(e.errno, "Setting line values: " + e.strerror)
+
+        self._values = values
+
+    def close(self):
+        try:
+            if self._line_fd is not None:
+                os.close(self._line_fd)
+        except OSError as e:
+            raise GPIOError(e.errno, "Closing GPIO line: " + e.strerror)
+
+        try:
+            if self._chip_fd is not None:
+                _close_chip(self._devpath)
+        except OSError as e:
+            raise GPIOError(e.errno, "Closing GPIO chip: " + e.strerror)
+
+        self._line_fd = None
+        self._chip_fd = None
+
+    # Immutable properties
+
+    @property
+    def devpath(self):
+        return self._devpath
+
+    @property
+    def fd(self):
+        return self._line_fd
+
+    @property
+    def chip_fd(self):
+        return self._chip_fd
+
+    @property
+    def lines(self):
+        return self._lines
+
+    @property
+    def direction(self):
+        return self._direction
+
+    @property
+    def bias(self):
+        return self._bias
+
+    @property
+    def drive(self):
+        return self._drive
+
+    @property
+    def inverted(self):
+        return self._inverted
+
+    # String representation
+
+    def __str__(self):
+        return "GPIO Bank (lines={}, device={:s}, line_fd={:d}, chip_fd={:d}, direction={:s}, bias={:s}, drive={:s}, inverted={:s}, type=cdev)" \
+            .format(list(self._lines), self._devpath, self._line_fd, self._chip_fd, self._direction, self._bias, self._drive, str(self._inverted))
@@ -1,19 +1,160 @@
+import ctypes
+import ctypes.util
 import errno
 import os
 import os.path
 import select
+import threading
 import time
+import warnings
 
-from .gpio import GPIO, GPIOError
+from . import _monotonic_ns
+from .gpio import GPIO, GPIOError, _DIRECTIONS, _EDGES, _TIMEOUT_TYPES
+
+
+# Positional read and write, which leave the file offset at zero for the
+# next access without a separate rewind (emulated before Python 3.3)
+if hasattr(os, "pread"):
+    _pread = os.pread
+    _pwrite = os.pwrite
+else:
+    def _pread(fd, length, offset):
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, length)
+
+    def _pwrite(fd, data, offset):
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.write(fd, data)
+
+
+# Close-on-exec for the file descriptors held open by this module, set
+# atomically at open (unavailable before Python 3.3)
+_O_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+
+# Export and unexport control files, opened on first use and kept open for
+# the life of the process. The lock is reentrant, as a GPIO may be closed and
+# unexported by garbage collection while it is held.
+_EXPORT_FD = None
+_UNEXPORT_FD = None
+_export_lock = threading.RLock()
+
+
+def _write_export(data):
+    global _EXPORT_FD
+
+    with _export_lock:
+        if _EXPORT_FD is None:
+            _EXPORT_FD = os.open("/sys/class/gpio/export", os.O_WRONLY | _O_CLOEXEC)
+        os.write(_EXPORT_FD, data)
+
+
+def _write_unexport(data):
+    global _UNEXPORT_FD
+
+    with _export_lock:
+        if _UNEXPORT_FD is None:
+            _UNEXPORT_FD = os.open("/sys/class/gpio/unexport", os.O_WRONLY | _O_CLOEXEC)
+        os.write(_UNEXPORT_FD, data)
+
+
+# Open sysfs GPIOs as character device GPIOs where the line's gpiochip has a
+# character device, enabled with PERIPHERY_PREFER_CDEV=1 in the environment.
+# The GPIO's line is then the line offset on the gpiochip, and GPIOs opened
+# with keep_exported remain sysfs GPIOs, as a character device line is
+# released on close.
+PREFER_CDEV = os.environ.get("PERIPHERY_PREFER_CDEV") == "1"
+
+
+def _find_cdev_line(line):
+    # Returns the (character device path, line offset) of a global sysfs line
+    # number, or None if it has no character device
+    try:
+        chips = os.listdir("/sys/class/gpio")
+    except OSError:
+        return None
+
+    for chip in chips:
+        if not chip.startswith("gpiochip"):
+            continue
+
+        chip_path = "/sys/class/gpio/" + chip
+
+        try:
+            with open(chip_path + "/base", "r") as f_base:
+                base = int(f_base.read())
+            with open(chip_path + "/ngpio", "r") as f_ngpio:
+                ngpio = int(f_ngpio.read())
+        except (IOError, ValueError):
+            continue
+
+        if base <= line < base + ngpio:
+            try:
+                cdev_path = "/dev/" + os.path.basename(os.readlink(chip_path + "/device"))
+            except OSError:
+                return None
+
+            return (cdev_path, line - base) if os.path.exists(cdev_path) else None
+
+    return None
+
+
+# inotify, used to wake up early while waiting for the GPIO directory to
+# appear after export and for udev to apply permissions to its attributes
+_IN_ATTRIB = 0x00000004
+_IN_CREATE = 0x00000100
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _HAVE_INOTIFY = hasattr(_libc, "inotify_init1")
+except OSError:
+    _HAVE_INOTIFY = False
+
+
+def _inotify_open(path, mask):
+    # Returns an inotify fd watching path, or None if inotify is unavailable
+    if not _HAVE_INOTIFY:
+        return None
+
+    fd = _libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+    if fd < 0:
+        return None
+
+    if _libc.inotify_add_watch(fd, path.encode(), mask) < 0:
+        os.close(fd)
+        return None
+
+    return fd
+
+
+def _inotify_wait(fd, timeout):
+    # Sleep for up to timeout seconds, returning early on an inotify event
+    if fd is None:
+        time.sleep(timeout)
+        return
+
+    p = select.poll()
+    p.register(fd, select.POLLIN)
+    if p.poll(int(timeout * 1000)):
+        try:
+            os.read(fd, 4096)
+        except OSError:
+            pass
 
 
 class SysfsGPIO(GPIO):
-    # Number of retries to check for GPIO export or direction on open
-    _GPIO_STAT_RETRIES = 10
-    # Delay between check for GPIO export or direction write on open (100ms)
+    # Timeout for GPIO export or direction on open (1s)
+    _GPIO_STAT_TIMEOUT = 1.0
+    # Maximum delay between check for GPIO export or direction write on open,
+    # when no inotify event arrives (100ms)
     _GPIO_STAT_DELAY = 0.1
+    # Value file payloads for high and low states
+    _VALUE_HIGH = b"1\n"
+    _VALUE_LOW = b"0\n"
 
-    def __init__(self, line, direction):
+    def __init__(self, line, direction, cache_direction=False, keep_exported=False):
         """**Sysfs GPIO**
 
         Instantiate a GPIO object and open the sysfs GPIO with the specified
@@ -23,17 +164,38 @@ class SysfsGPIO(GPIO):
         low; "high" for output, initialized to high; or "low" for output,
         initialized to low.
 
+        By default, the `direction` property is read back from sysfs on every
+        access, since other processes may change it. If `cache_direction` is
+        True, the direction is remembered after the first read or write and
+        changes made outside of this object will not be seen.
+
+        A line exported by this object is unexported when it is closed. If
+        `keep_exported` is True, the line is left exported instead, e.g. for
+        handing it off to another process or reopening it shortly after.
+
+        If `PREFER_CDEV` is set, which is enabled with
+        ``PERIPHERY_PREFER_CDEV=1`` in the environment, a line whose gpiochip
+        has a character device is opened as a character device GPIO instead,
+        and a DeprecationWarning is emitted. The returned GPIO's `line` is then
+        the line offset on the gpiochip, not the sysfs line number, and
+        `cache_direction` has no effect. Lines opened with `keep_exported` are
+        always opened as sysfs GPIOs, since a character device line is
+        released on close.
+
         Args:
             line (int): GPIO line number.
             direction (str): GPIO direction, can be "in", "out", "high", or
                              "low",
+            cache_direction (bool): cache the GPIO direction.
+            keep_exported (bool): leave the line exported on close.
 
         Returns:
             SysfsGPIO: GPIO object.
 
         Raises:
             GPIOError: if an I/O or OS error occurs.
-            TypeError: if `line` or `direction`  types are invalid.
+            TypeError: if `line`, `direction`, `cache_direction`, or
+                       `keep_exported` types are invalid.
             ValueError: if `direction` value is invalid.
             TimeoutError: if waiting for GPIO export times out.
 
@@ -41,87 +203,157 @@ class SysfsGPIO(GPIO):
         self._fd = None
         self._line = None
         self._exported = False
+        self._attr_fds = {}
+        self._epoll = None
+        self._chip_name = None
+        self._chip_label = None
+        self._cache_direction = False
+        self._direction = None
+        self._keep_exported = False
+
+        self._open(line, direction, cache_direction, keep_exported)
+
+    def __new__(self, line, direction, cache_direction=False, keep_exported=False):
+        if PREFER_CDEV and isinstance(line, int) and keep_exported is False:
+            cdev_line = _find_cdev_line(line)
+            if cdev_line is not None:
+                from .gpio import _SysfsCdevGPIO
+
+                warnings.warn("Sysfs GPIO {:d} opened as character device GPIO {:s} line {:d}, its line property is the line offset on the gpiochip".format(line, *cdev_line), DeprecationWarning, stacklevel=2)
+
+                gpio = object.__new__(_SysfsCdevGPIO)
+                gpio._cdev_line = cdev_line
+
+                # __init__() only runs automatically when constructed through
+                # GPIO(), as the object is not a SysfsGPIO
+                if not isinstance(gpio, self):
+                    gpio.__init__(line, direction, cache_direction, keep_exported)
 
-        self._open(line, direction)
+                return gpio
 
-    def __new__(self, line, direction):
         return object.__new__(SysfsGPIO)
 
-    def _open(self, line, direction):
+    def _open(self, line, direction, cache_direction, keep_exported):
         if not isinstance(line, int):
             raise TypeError("Invalid line type, should be integer.")
         if not isinstance(direction, str):
             raise TypeError("Invalid direction type, should be string.")
-        if direction.lower() not in ["in", "out", "high", "low"]:
+        if direction.lower() not in _DIRECTIONS:
             raise ValueError("Invalid direction, can be: \"in\", \"out\", \"high\", \"low\".")
+        if not isinstance(cache_direction, bool):
+            raise TypeError("Invalid cache_direction type, should be bool.")
+        if not isinstance(keep_exported, bool):
+            raise TypeError("Invalid keep_exported type, should be bool.")
 
         gpio_path = "/sys/class/gpio/gpio{:d}".format(line)
+        self._line_data = "{:d}\n".format(line).encode()
+        direction_path = gpio_path + "/direction"
 
         if not os.path.isdir(gpio_path):
-            # Export the line
+            # Watch for the GPIO directory before exporting, so its creation
+            # can't be missed
+            watch_fd = _inotify_open("/sys/class/gpio", _IN_CREATE)
+
             try:
-                with open("/sys/class/gpio/export", "w") as f_export:
-                    f_export.write("{:d}\n".format(line))
-            except IOError as e:
-                raise GPIOError(e.errno, "Exporting GPIO: " + e.strerror)
+                # Export the line
+                try:
+                    _write_export(self._line_data)
+                except OSError as e:
+                    raise GPIOError(e.errno, "Exporting GPIO: " + e.strerror)
+
+                # Loop until GPIO is exported. The directory is rechecked after
+                # each wakeup, as the event may be for another entry.
+                deadline = _monotonic_ns() + int(SysfsGPIO._GPIO_STAT_TIMEOUT * 1e9)
+                while True:
+                    if os.path.isdir(gpio_path):
+                        self._exported = True
+                        break
 
-            # Loop until GPIO is exported
-            for i in range(SysfsGPIO._GPIO_STAT_RETRIES):
-                if os.path.isdir(gpio_path):
-                    self._exported = True
-                    break
+                    remaining = (deadline - _monotonic_ns()) / 1e9
+                    if remaining <= 0:
+                        break
 
-                time.sleep(SysfsGPIO._GPIO_STAT_DELAY)
+                    _inotify_wait(watch_fd, min(remaining, SysfsGPIO._GPIO_STAT_DELAY))
+            finally:
+                if watch_fd is not None:
+                    os.close(watch_fd)
 
             if not self._exported:
                 raise TimeoutError("Exporting GPIO: waiting for \"{:s}\" timed out".format(gpio_path))
 
             # Loop until direction is writable. This could take some time after
             # export as application of udev rules after export is asynchronous.
-            for i in range(SysfsGPIO._GPIO_STAT_RETRIES):
-                try:
-                    with open(os.path.join(gpio_path, "direction"), 'w'):
-                        break
-                except IOError as e:
-                    if e.errno != errno.EACCES or (e.errno == errno.EACCES and i == SysfsGPIO._GPIO_STAT_RETRIES - 1):
-                        raise GPIOError(e.errno, "Opening GPIO direction: " + e.strerror)
+            watch_fd = _inotify_open(direction_path, _IN_ATTRIB)
 
-                time.sleep(SysfsGPIO._GPIO_STAT_DELAY)
+            try:
+                deadline = _monotonic_ns() + int(SysfsGPIO._GPIO_STAT_TIMEOUT * 1e9)
+                while True:
+                    try:
+                        with open(direction_path, 'w'):
+                            break
+                    except IOError as e:
+                        remaining = (deadline - _monotonic_ns()) / 1e9
+                        if e.errno != errno.EACCES or remaining <= 0:
+                            raise GPIOError(e.errno, "Opening GPIO direction: " + e.strerror)
+
+                    _inotify_wait(watch_fd, min(remaining, SysfsGPIO._GPIO_STAT_DELAY))
+            finally:
+                if watch_fd is not None:
+                    os.close(watch_fd)
 
         # Open value
         try:
-            self._fd = os.open(os.path.join(gpio_path, "value"), os.O_RDWR)
+            self._fd = os.open(gpio_path + "/value", os.O_RDWR | _O_CLOEXEC)
         except OSError as e:
             raise GPIOError(e.errno, "Opening GPIO: " + e.strerror)
 
         self._line = line
         self._path = gpio_path
+        self._cache_direction = cache_direction
+        self._keep_exported = keep_exported
+        self._attr_paths = {
+            "direction": direction_path,
+            "edge": gpio_path + "/edge",
+            "active_low": gpio_path + "/active_low",
+            "device": gpio_path + "/device",
+        }
 
         # Initialize direction
         if self.direction != direction.lower():
             self.direction = direction
 
+    def _attr_fd(self, name, flags):
+        # Open attribute files on first access and keep them open, as
+        # reopening them costs a path lookup on every access
+        fd = self._attr_fds.get((name, flags))
+        if fd is None:
+            fd = os.open(self._attr_paths[name], flags | _O_CLOEXEC)
+            self._attr_fds[(name, flags)] = fd
+
+        return fd
+
+    def _read_attr(self, name):
+        return _pread(self._attr_fd(name, os.O_RDONLY), 16, 0).decode()
+
+    def _write_attr(self, name, value):
+        _pwrite(self._attr_fd(name, os.O_WRONLY), value.encode(), 0)
+
     # Methods
 
     def read(self):
         # Read value
         try:
-            buf = os.read(self._fd, 2)
+            buf = _pread(self._fd, 2, 0)
         except OSError as e:
             raise GPIOError(e.errno, "Reading GPIO: " + e.strerror)
 
-        # Rewind
-        try:
-            os.lseek(self._fd, 0, os.SEEK_SET)
-        except OSError as e:
-            raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror)
-
-        if buf[0] == b"0"[0]:
-            return False
-        elif buf[0] == b"1"[0]:
-            return True
+        # Map ASCII "0"/"1" to 0/1 in one step (ord() of a one byte slice
+        # works for both Python 2 str and Python 3 bytes)
+        v = ord(buf[0:1]) ^ 0x30
+        if v > 1:
+            raise GPIOError(None, "Unknown GPIO value: {}".format(buf))
 
-        raise GPIOError(None, "Unknown GPIO value: {}".format(buf))
+        return bool(v)
 
     def write(self, value):
         if not isinstance(value, bool):
@@ -129,69 +361,101 @@ class SysfsGPIO(GPIO):
 
         # Write value
         try:
-            if value:
-                os.write(self._fd, b"1\n")
-            else:
-                os.write(self._fd, b"0\n")
+            _pwrite(self._fd, SysfsGPIO._VALUE_HIGH if value else SysfsGPIO._VALUE_LOW, 0)
         except OSError as e:
             raise GPIOError(e.errno, "Writing GPIO: " + e.strerror)
 
-        # Rewind
+    def write_fast(self, value):
         try:
-            os.lseek(self._fd, 0, os.SEEK_SET)
+            _pwrite(self._fd, SysfsGPIO._VALUE_HIGH if value else SysfsGPIO._VALUE_LOW, 0)
         except OSError as e:
-            raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror)
+            raise GPIOError(e.errno, "Writing GPIO: " + e.strerror)
+
+    def toggle(self):
+        self.write(not self.read())
+
+    def write_many(self, values):
+        if not isinstance(values, (list, tuple)):
+            raise TypeError("Invalid values type, should be list or tuple.")
+
+        elif not all(isinstance(value, bool) for value in values):
+            raise TypeError("Invalid value type, should be bool.")
+
+        fd = self._fd
+        high = SysfsGPIO._VALUE_HIGH
+        low = SysfsGPIO._VALUE_LOW
+
+        try:
+            for value in values:
+                _pwrite(fd, high if value else low, 0)
+        except OSError as e:
+            raise GPIOError(e.errno, "Writing GPIO: " + e.strerror)
+
+    def snapshot(self):
+        raise NotImplementedError()
 
     def poll(self, timeout=None):
-        if not isinstance(timeout, (int, float, type(None))):
+        if not isinstance(timeout, _TIMEOUT_TYPES):
             raise TypeError("Invalid timeout type, should be integer, float, or None.")
 
-        # Setup poll
-        p = select.poll()
-        p.register(self._fd, select.POLLPRI | select.POLLERR)
-
-        # Scale timeout to milliseconds
-        if isinstance(timeout, (int, float)) and timeout > 0:
-            timeout *= 1000
+        # Setup epoll on first poll, and retain it for the lifetime of the
+        # value file descriptor
+        if self._epoll is None:
+            self._epoll = select.epoll()
+            self._epoll.register(self._fd, select.EPOLLPRI | select.EPOLLERR)
 
         # Poll
-        events = p.poll(timeout)
+        events = self._epoll.poll(-1 if timeout is None else timeout)
 
-        # If GPIO edge interrupt occurred
-        if events:
-            # Rewind
-            try:
-                os.lseek(self._fd, 0, os.SEEK_SET)
-            except OSError as e:
-                raise GPIOError(e.errno, "Rewinding GPIO: " + e.strerror)
+        # The value file is only read with pread() at offset 0, so no rewind
+        # is needed before the edge event is consumed with read()
+        return len(events) > 0
 
-            return True
+    def read_event(self):
+        raise NotImplementedError()
 
-        return False
+    def wait_event(self, timeout=None):
+        raise NotImplementedError()
 
-    def read_event(self):
+    def wait_event_async(self, timeout=None):
+        raise NotImplementedError()
+
+    def read_events(self, max_events=16):
         raise NotImplementedError()
 
     def close(self):
         if self._fd is None:
             return
 
-        try:
-            os.close(self._fd)
-        except OSError as e:
-            raise GPIOError(e.errno, "Closing GPIO: " + e.strerror)
+        if self._epoll is not None:
+            self._epoll.close()
+            self._epoll = None
 
+        fds = [(self._fd, "Closing GPIO: ")]
+        fds += [(fd, "Closing GPIO attribute: ") for fd in self._attr_fds.values()]
         self._fd = None
+        self._attr_fds = {}
+
+        # Close value and attribute files, raising the first error only after
+        # all of them are closed and the line is unexported
+        error = None
+        for fd, message in fds:
+            try:
+                os.close(fd)
+            except OSError as e:
+                if error is None:
+                    error = GPIOError(e.errno, message + e.strerror)
 
-        if self._exported:
+        if self._exported and not self._keep_exported:
             # Unexport the line
             try:
-                unexport_fd = os.open("/sys/class/gpio/unexport", os.O_WRONLY)
-                os.write(unexport_fd, "{:d}\n".format(self._line).encode())
-                os.close(unexport_fd)
+                _write_unexport(self._line_data)
             except OSError as e:
                 raise GPIOError(e.errno, "Unexporting GPIO: " + e.strerror)
 
+        if error is not None:
+            raise error
+
     # Immutable properties
 
     @property
@@ -220,17 +484,24 @@ class SysfsGPIO(GPIO):
 
     @property
     def chip_name(self):
-        gpio_path = os.path.join(self._path, "device")
+        # Chip name is fixed, so only resolve the device symlink once
+        if self._chip_name is not None:
+            return self._chip_name
 
-        gpiochip_path = os.readlink(gpio_path)
+        gpiochip_path = os.readlink(self._attr_paths["device"])
 
         if '/' not in gpiochip_path:
             raise GPIOError(None, "Reading gpiochip name: invalid device symlink \"{:s}\"".format(gpiochip_path))
 
-        return gpiochip_path.split('/')[-1]
+        self._chip_name = os.path.basename(gpiochip_path)
+
+        return self._chip_name
 
     @property
     def chip_label(self):
+        if self._chip_label is not None:
+            return self._chip_label
+
         gpio_path = "/sys/class/gpio/{:s}/label".format(self.chip_name)
 
         try:
@@ -242,41 +513,51 @@ class SysfsGPIO(GPIO):
 
             raise GPIOError(None, "Reading gpiochip label: " + e.strerror)
 
-        return label.strip()
+        self._chip_label = label.strip()
+
+        return self._chip_label
 
     # Mutable properties
 
     def _get_direction(self):
+        if self._direction is not None:
+            return self._direction
+
         # Read direction
         try:
-            with open(os.path.join(self._path, "direction"), "r") as f_direction:
-                direction = f_direction.read()
-        except IOError as e:
+            direction = self._read_attr("direction").strip()
+        except OSError as e:
             raise GPIOError(e.errno, "Getting GPIO direction: " + e.strerror)
 
-        return direction.strip()
+        if self._cache_direction:
+            self._direction = direction
+
+        return direction
 
     def _set_direction(self, direction):
         if not isinstance(direction, str):
             raise TypeError("Invalid direction type, should be string.")
-        if direction.lower() not in ["in", "out", "high", "low"]:
+
+        direction = direction.lower()
+        if direction not in _DIRECTIONS:
             raise ValueError("Invalid direction, can be: \"in\", \"out\", \"high\", \"low\".")
 
         # Write direction
         try:
-            with open(os.path.join(self._path, "direction"), "w") as f_direction:
-                f_direction.write(direction.lower() + "\n")
-        except IOError as e:
+            self._write_attr("direction", direction + "\n")
+        except OSError as e:
             raise GPIOError(e.errno, "Setting GPIO direction: " + e.strerror)
 
+        if self._cache_direction:
+            self._direction = "in" if direction == "in" else "out"
+
     direction = property(_get_direction, _set_direction)
 
     def _get_edge(self):
         # Read edge
         try:
-            with open(os.path.join(self._path, "edge"), "r") as f_edge:
-                edge = f_edge.read()
-        except IOError as e:
+            edge = self._read_attr("edge")
+        except OSError as e:
             raise GPIOError(e.errno, "Getting GPIO edge: " + e.strerror)
 
         return edge.strip()
@@ -284,14 +565,15 @@ class SysfsGPIO(GPIO):
     def _set_edge(self, edge):
         if not isinstance(edge, str):
             raise TypeError("Invalid edge type, should be string.")
-        if edge.lower() not in ["none", "rising", "falling", "both"]:
+
+        edge = edge.lower()
+        if edge not in _EDGES:
             raise ValueError("Invalid edge, can be: \"none\", \"rising\", \"falling\", \"both\".")
 
         # Write edge
         try:
-            with open(os.path.join(self._path, "edge"), "w") as f_edge:
-                f_edge.write(edge.lower() + "\n")
-        except IOError as e:
+            self._write_attr("edge", edge + "\n")
+        except OSError as e:
             raise GPIOError(e.errno, "Setting GPIO edge: " + e.strerror)
 
     edge = property(_get_edge, _set_edge)
@@ -315,9 +597,8 @@ class SysfsGPIO(GPIO):
     def _get_inverted(self):
         # Read active_low
         try:
-            with open(os.path.join(self._path, "active_low"), "r") as f_inverted:
-                inverted = f_inverted.read().strip()
-        except IOError as e:
+            inverted = self._read_attr("active_low").strip()
+        except OSError as e:
             raise GPIOError(e.errno, "Getting GPIO active_low: " + e.strerror)
 
         if inverted == "0":
@@ -333,40 +614,23 @@ class SysfsGPIO(GPIO):
 
         # Write active_low
         try:
-            with open(os.path.join(self._path, "active_low"), "w") as f_active_low:
-                f_active_low.write("1\n" if inverted else "0\n")
-        except IOError as e:
+            self._write_attr("active_low", "1\n" if inverted else "0\n")
+        except OSError as e:
             raise GPIOError(e.errno, "Setting GPIO active_low: " + e.strerror)
 
     inverted = property(_get_inverted, _set_inverted)
 
     # String representation
 
-    def __str__(self):
-        try:
-            str_direction = self.direction
-        except GPIOError:
-            str_direction = "<error>"
-
-        try:
-            str_edge = self.edge
-        except GPIOError:
-            str_edge = "<error>"
-
+    def _str_property(self, name):
+        # Format a property for __str__(), substituting "<error>" if it can't
+        # be read
         try:
-            str_chip_name = self.chip_name
+            return str(getattr(self, name))
         except GPIOError:
-            str_chip_name = "<error>"
-
-        try:
-            str_chip_label = self.chip_label
-        except GPIOError:
-            str_chip_label = "<error>"
-
-        try:
-            str_inverted = str(self.inverted)
-        except GPIOError:
-            str_inverted = "<error>"
+            return "<error>"
 
+    def __str__(self):
         return "GPIO {:d} (device={:s}, fd={:d}, direction={:s}, edge={:s}, inverted={:s}, chip_name=\"{:s}\", chip_label=\"{:s}\", type=sysfs)" \
-            .format(self._line, self._path, self._fd, str_direction, str_edge, str_inverted, str_chip_name, str_chip_label)
+            .format(self._line, self._path, self._fd, self._str_property("direction"), self._str_property("edge"),
+                    self._str_property("inverted"), self._str_property("chip_name"), self._str_property("chip_label"))
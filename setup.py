@@ -3,9 +3,16 @@ try:
 except ImportError:
     from distutils.core import setup
 
+import os
+import re
+
+# Read version from package, to keep a single source of truth
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'periphery', '__init__.py')) as f:
+    version = '.'.join(re.search(r'^version = \((\d+), (\d+), (\d+)\)', f.read(), re.MULTILINE).groups())
+
 setup(
     name='python-periphery',
-    version='2.4.1',
+    version=version,
     description='A pure Python 2/3 library for peripheral I/O (GPIO, LED, PWM, SPI, I2C, MMIO, Serial) in Linux.',
     author='vsergeev',
     author_email='v@sergeev.io',
@@ -0,0 +1,6 @@
+# Coroutines for the GPIO tests, kept in their own module as the tests also
+# run on Python 2. Only import this module on Python 3.5 or later.
+
+
+async def wait_event(gpio, timeout=None):
+    return await gpio.wait_event_async(timeout)
@@ -31,6 +31,26 @@ def test_arguments():
     # Invalid direction
     with AssertRaises("invalid direction", ValueError):
         periphery.GPIO("abc", 1, "blah")
+    # Invalid open types with factory
+    with AssertRaises("invalid open types", TypeError):
+        periphery.GPIO.open_cdev(1, 1, "in")
+    # Invalid direction with factory
+    with AssertRaises("invalid direction", ValueError):
+        periphery.GPIO.open_cdev("abc", 1, "blah")
+
+    # Invalid bank open types
+    with AssertRaises("invalid bank open types", TypeError):
+        periphery.GPIOBank("abc", 1, "in")
+    with AssertRaises("invalid bank open types", TypeError):
+        periphery.GPIOBank("abc", ["a"], "in")
+    # Invalid bank lines
+    with AssertRaises("invalid bank lines", ValueError):
+        periphery.GPIOBank("abc", [], "in")
+    with AssertRaises("invalid bank lines", ValueError):
+        periphery.GPIOBank("abc", list(range(65)), "in")
+    # Invalid bank direction
+    with AssertRaises("invalid bank direction", ValueError):
+        periphery.GPIOBank("abc", [1], "blah")
 
 
 def test_open_close():
@@ -151,6 +171,20 @@ def test_open_close():
     passert("inverted is False", gpio.inverted == False)
     passert("label is test123", gpio.label == "test123")
 
+    # Check snapshot
+    snapshot = gpio.snapshot()
+    passert("snapshot line", snapshot.line == line_input)
+    passert("snapshot direction is in", snapshot.direction == "in")
+    passert("snapshot edge is rising", snapshot.edge == "rising")
+    passert("snapshot label is test123", snapshot.label == "test123")
+    passert("snapshot value is bool", isinstance(snapshot.value, bool))
+
+    # Open another line on the same chip, check chip fd is shared
+    gpio2 = periphery.GPIO(path, line_input, "in")
+    passert("chip fd is shared", gpio2.chip_fd == gpio.chip_fd)
+    gpio2.close()
+    passert("chip fd still open", os.fstat(gpio.chip_fd) is not None)
+
     gpio.close()
 
 
@@ -171,6 +205,48 @@ def test_loopback():
     gpio_out.write(True)
     passert("value is True", gpio_in.read() == True)
 
+    # Drive out low and high with toggle(), write_many(), and write_fast(),
+    # check in follows
+    print("Drive out with toggle(), write_many(), and write_fast(), check in follows")
+    gpio_out.toggle()
+    passert("value is False after toggle", gpio_in.read() == False)
+    gpio_out.toggle()
+    passert("value is True after toggle", gpio_in.read() == True)
+    gpio_out.write_many([False, True, False, True, False])
+    passert("value is False after sequence", gpio_in.read() == False)
+    gpio_out.write_many([True, False, True])
+    passert("value is True after sequence", gpio_in.read() == True)
+    gpio_out.write_fast(False)
+    passert("value is False after fast write", gpio_in.read() == False)
+    gpio_out.write_fast(True)
+    passert("value is True after fast write", gpio_in.read() == True)
+
+    # Set out direction low and high, check in follows without a reopen
+    print("Set out direction low and high, check in follows")
+    line_fd = gpio_out.fd
+    gpio_out.direction = "low"
+    passert("value is False", gpio_in.read() == False)
+    gpio_out.direction = "high"
+    passert("value is True", gpio_in.read() == True)
+    passert("line fd unchanged", gpio_out.fd == line_fd)
+
+    # Set inverted out direction low and high, check in follows physical level
+    print("Set inverted out direction low and high, check in follows")
+    gpio_out.inverted = True
+    gpio_out.direction = "low"
+    passert("value is False", gpio_in.read() == False)
+    gpio_out.direction = "high"
+    passert("value is True", gpio_in.read() == True)
+    gpio_out.inverted = False
+
+    # Invert out, check in still high
+    print("Invert out, check in still high")
+    gpio_out.inverted = True
+    passert("value is True", gpio_in.read() == True)
+    passert("inverted value is False", gpio_out.read() == False)
+    gpio_out.inverted = False
+    passert("value is True", gpio_in.read() == True)
+
     # Wrapper for running poll() in a thread
     def threaded_poll(gpio, timeout):
         ret = queue.Queue()
@@ -260,6 +336,56 @@ def test_loopback():
     gpios_ready = periphery.GPIO.poll_multiple([gpio_in], 1)
     passert("gpios ready is empty", gpios_ready == [])
 
+    # Check poll falling 1 -> 0 interrupt with a duplicate in poll_multiple()
+    print("Check poll falling 1 -> 0 interrupt with duplicate poll_multiple()")
+    gpio_out.write(False)
+    gpios_ready = periphery.GPIO.poll_multiple([gpio_in, gpio_in], 1)
+    passert("gpios ready is gpio_in", gpios_ready == [gpio_in])
+    event = gpio_in.read_event()
+    passert("event edge is falling", event.edge == "falling")
+    gpio_out.write(True)
+    event = gpio_in.read_event()
+    passert("event edge is rising", event.edge == "rising")
+
+    # Check reading multiple events with the read_events() API
+    print("Check falling and rising interrupts with read_events()")
+    gpio_out.write(False)
+    gpio_out.write(True)
+    passert("gpio_in polled True", gpio_in.poll(1) == True)
+    events = gpio_in.read_events()
+    passert("two events read", len(events) == 2)
+    passert("first event edge is falling", events[0].edge == "falling")
+    passert("second event edge is rising", events[1].edge == "rising")
+    passert("event timestamps are increasing", events[0].timestamp <= events[1].timestamp)
+
+    # Check waiting for events with the wait_event() API
+    print("Check falling and rising interrupts with wait_event()")
+    gpio_out.write(False)
+    event = gpio_in.wait_event(1)
+    passert("event edge is falling", event.edge == "falling")
+    gpio_out.write(True)
+    event = gpio_in.wait_event()
+    passert("event edge is rising", event.edge == "rising")
+    passert("wait_event timed out", gpio_in.wait_event(1) is None)
+
+    # Check waiting for events with the wait_event_async() API
+    if sys.version_info[:2] >= (3, 5):
+        import asyncio
+        from .gpio_async import wait_event
+
+        print("Check falling and rising interrupts with wait_event_async()")
+        loop = asyncio.new_event_loop()
+        gpio_out.write(False)
+        event = loop.run_until_complete(wait_event(gpio_in, 1))
+        passert("event is EdgeEvent", isinstance(event, periphery.EdgeEvent))
+        passert("event edge is falling", event.edge == "falling")
+        gpio_out.write(True)
+        event = loop.run_until_complete(wait_event(gpio_in))
+        passert("event is EdgeEvent", isinstance(event, periphery.EdgeEvent))
+        passert("event edge is rising", event.edge == "rising")
+        passert("wait_event_async timed out", loop.run_until_complete(wait_event(gpio_in, 1)) is None)
+        loop.close()
+
     gpio_in.close()
     gpio_out.close()
 
@@ -282,6 +408,33 @@ def test_loopback():
     gpio_in.close()
     gpio_out.close()
 
+    # Open input and output banks
+    bank_in = periphery.GPIOBank(path, [line_input], "in")
+    bank_out = periphery.GPIOBank(path, [line_output], "out")
+    passert("bank lines", bank_out.lines == (line_output,))
+
+    # Drive bank out low, check bank in low
+    print("Drive bank out low, check bank in low")
+    bank_out.write(0b0)
+    passert("values are 0b0", bank_in.read() == 0b0)
+
+    # Drive bank out high, check bank in high
+    print("Drive bank out high, check bank in high")
+    bank_out.write(0b1)
+    passert("values are 0b1", bank_in.read() == 0b1)
+
+    # Drive bank out low with mask excluding line, check bank in still high
+    print("Drive bank out low with empty mask, check bank in still high")
+    bank_out.write(0b0, 0b0)
+    passert("values are 0b1", bank_in.read() == 0b1)
+
+    # Attempt to write to input bank
+    with AssertRaises("write to input bank", periphery.GPIOError):
+        bank_in.write(0b1)
+
+    bank_in.close()
+    bank_out.close()
+
 
 def test_interactive():
     print("Starting interactive test...")
@@ -2,6 +2,7 @@ import os
 import sys
 import threading
 import time
+import warnings
 
 import periphery
 from .test import ptest, pokay, passert, AssertRaises
@@ -28,6 +29,18 @@ def test_arguments():
     # Invalid direction
     with AssertRaises("invalid direction", ValueError):
         periphery.GPIO(100, "blah")
+    # Invalid open types with factory
+    with AssertRaises("invalid open types", TypeError):
+        periphery.GPIO.open_sysfs("abc", "out")
+    # Invalid direction with factory
+    with AssertRaises("invalid direction", ValueError):
+        periphery.GPIO.open_sysfs(100, "blah")
+    # Invalid cache_direction type
+    with AssertRaises("invalid cache_direction type", TypeError):
+        periphery.GPIO(100, "in", cache_direction=1)
+    # Invalid keep_exported type
+    with AssertRaises("invalid keep_exported type", TypeError):
+        periphery.GPIO(100, "in", keep_exported=1)
 
 
 
@@ -66,6 +79,14 @@ def test_open_close():
     # Unsupported method
     with AssertRaises("unsupported method", NotImplementedError):
         gpio.read_event()
+    with AssertRaises("unsupported method", NotImplementedError):
+        gpio.read_events()
+    with AssertRaises("unsupported method", NotImplementedError):
+        gpio.wait_event()
+    with AssertRaises("unsupported method", NotImplementedError):
+        gpio.wait_event_async()
+    with AssertRaises("unsupported method", NotImplementedError):
+        gpio.snapshot()
 
     # Set direction out, check direction out, check value low
     gpio.direction = "out"
@@ -109,6 +130,53 @@ def test_open_close():
 
     gpio.close()
 
+    # Open with cached direction, check direction tracks writes
+    gpio = periphery.GPIO(line_output, "in", cache_direction=True)
+    passert("direction is in", gpio.direction == "in")
+    gpio.direction = "high"
+    passert("direction is out", gpio.direction == "out")
+    passert("value is high", gpio.read() == True)
+    gpio.direction = "in"
+    passert("direction is in", gpio.direction == "in")
+    gpio.close()
+
+    # Open with keep exported, check line is still exported after close
+    gpio_path = "/sys/class/gpio/gpio{:d}".format(line_output)
+    was_exported = os.path.isdir(gpio_path)
+    gpio = periphery.GPIO(line_output, "in", keep_exported=True)
+    gpio.close()
+    passert("line still exported", os.path.isdir(gpio_path))
+    if not was_exported:
+        with open("/sys/class/gpio/unexport", "w") as f_unexport:
+            f_unexport.write("{:d}\n".format(line_output))
+
+    # Open with PREFER_CDEV, check line is opened as a character device GPIO
+    # if its gpiochip has one, and as a sysfs GPIO with keep exported
+    cdev_line = periphery.gpio_sysfs._find_cdev_line(line_output)
+    if cdev_line is not None and not was_exported:
+        periphery.gpio_sysfs.PREFER_CDEV = True
+        try:
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                gpio = periphery.GPIO(line_output, "out")
+            passert("DeprecationWarning emitted", len(w) == 1 and w[0].category is DeprecationWarning)
+            passert("opened as character device GPIO", isinstance(gpio, periphery.CdevGPIO))
+            passert("property line is line offset", gpio.line == cdev_line[1])
+            passert("direction is out", gpio.direction == "out")
+            passert("value is low", gpio.read() == False)
+            gpio.close()
+            passert("line not exported", not os.path.isdir(gpio_path))
+
+            gpio = periphery.GPIO(line_output, "in", keep_exported=True)
+            passert("opened as sysfs GPIO", isinstance(gpio, periphery.SysfsGPIO))
+            passert("property line", gpio.line == line_output)
+            gpio.close()
+            passert("line still exported", os.path.isdir(gpio_path))
+            with open("/sys/class/gpio/unexport", "w") as f_unexport:
+                f_unexport.write("{:d}\n".format(line_output))
+        finally:
+            periphery.gpio_sysfs.PREFER_CDEV = False
+
 
 def test_loopback():
     ptest()
@@ -127,6 +195,22 @@ def test_loopback():
     gpio_out.write(True)
     passert("value is high", gpio_in.read() == True)
 
+    # Drive out low and high with toggle(), write_many(), and write_fast(),
+    # check in follows
+    print("Drive out with toggle(), write_many(), and write_fast(), check in follows")
+    gpio_out.toggle()
+    passert("value is low after toggle", gpio_in.read() == False)
+    gpio_out.toggle()
+    passert("value is high after toggle", gpio_in.read() == True)
+    gpio_out.write_many([False, True, False, True, False])
+    passert("value is low after sequence", gpio_in.read() == False)
+    gpio_out.write_many([True, False, True])
+    passert("value is high after sequence", gpio_in.read() == True)
+    gpio_out.write_fast(False)
+    passert("value is low after fast write", gpio_in.read() == False)
+    gpio_out.write_fast(True)
+    passert("value is high after fast write", gpio_in.read() == True)
+
     # Wrapper for running poll() in a thread
     def threaded_poll(gpio, timeout):
         ret = queue.Queue()
@@ -177,7 +261,15 @@ def test_loopback():
 
     # Check poll timeout
     print("Check poll timeout")
+    start = time.time()
     passert("gpio_in polled False", gpio_in.poll(1) == False)
+    passert("poll timeout is in seconds", 0.9 <= time.time() - start < 2)
+
+    # Check non-blocking poll
+    print("Check non-blocking poll")
+    start = time.time()
+    passert("gpio_in polled False", gpio_in.poll(0) == False)
+    passert("non-blocking poll returns immediately", time.time() - start < 0.5)
 
     # Check poll falling 1 -> 0 interrupt with the poll_multiple() API
     print("Check poll falling 1 -> 0 interrupt with poll_multiple()")
@@ -198,6 +290,14 @@ def test_loopback():
     gpios_ready = periphery.GPIO.poll_multiple([gpio_in], 1)
     passert("gpios ready is empty", gpios_ready == [])
 
+    # Check poll falling 1 -> 0 interrupt with a duplicate in poll_multiple()
+    print("Check poll falling 1 -> 0 interrupt with duplicate poll_multiple()")
+    gpio_out.write(False)
+    gpios_ready = periphery.GPIO.poll_multiple([gpio_in, gpio_in], 1)
+    passert("gpios ready is gpio_in", gpios_ready == [gpio_in])
+    passert("value is low", gpio_in.read() == False)
+    gpio_out.write(True)
+
     gpio_in.close()
     gpio_out.close()
 